@@ -54,7 +54,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements if requirements else [
-        "python-telegram-bot>=20.0",
+        "python-telegram-bot[rate-limiter]>=20.0",
         "yt-dlp>=2026.2.4",
         "webdavclient3==3.14.6",
         "python-dotenv>=0.19.0",
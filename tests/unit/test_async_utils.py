@@ -0,0 +1,88 @@
+"""
+Unit tests for async utilities
+"""
+
+import asyncio
+import pytest
+
+from ytbot.utils.async_utils import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test callers with the same key get one shared result"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        results = await asyncio.gather(*(flight.do('key', work) for _ in range(5)))
+
+        assert results == ['result'] * 5
+        assert calls == 1
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_every_caller(self):
+        """Test a failure is raised to all waiting callers"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        results = await asyncio.gather(
+            flight.do('key', work), flight.do('key', work), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test only the cancelled caller sees CancelledError"""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return 'result'
+
+        leader = asyncio.create_task(flight.do('key', work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do('key', work))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == 'result'
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_new_call_after_completion_runs_again(self):
+        """Test a finished call is not reused for later callers"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do('key', work) == 1
+        assert await flight.do('key', work) == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,205 @@
+"""
+Unit tests for the cache manager
+"""
+
+import json
+import pytest
+from datetime import datetime
+
+from ytbot.storage import cache_manager as cache_manager_module
+from ytbot.storage.cache_manager import CacheManager, get_cache_manager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Cache manager backed by a database in a temporary directory"""
+    cm = CacheManager(cache_dir=str(tmp_path))
+    yield cm
+    cm.close()
+
+
+def make_file(tmp_path, name, content=b'data'):
+    """Create a file to cache and return its path"""
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def write_legacy_queue(tmp_path, items):
+    """Write a cache_queue.json in the format used by earlier versions"""
+    legacy_file = tmp_path / 'cache_queue.json'
+    legacy_file.write_text(json.dumps({'cache_queue': items}), encoding='utf-8')
+    return legacy_file
+
+
+class TestLegacyImport:
+    """Tests for importing the old JSON queue file"""
+
+    def test_imports_legacy_entries(self, tmp_path):
+        """Test entries from cache_queue.json end up in the database"""
+        first = make_file(tmp_path, 'first.mp4', b'x' * 10)
+        second = make_file(tmp_path, 'second.mp3')
+        legacy_file = write_legacy_queue(tmp_path, [
+            {'file_path': first, 'filename': 'first.mp4', 'content_type': 'video',
+             'timestamp': '2024-01-01T00:00:00'},
+            {'file_path': second, 'filename': 'second.mp3', 'content_type': 'audio',
+             'timestamp': '2024-01-02T00:00:00', 'metadata': {'source': 'test'}},
+            {'filename': 'no_path.mp4'},
+        ])
+
+        cm = CacheManager(cache_dir=str(tmp_path))
+        try:
+            queue = cm.get_cache_queue()
+            assert [entry['file_path'] for entry in queue] == [first, second]
+            assert queue[0]['size'] == 10
+            assert queue[1]['metadata']['source'] == 'test'
+            assert queue[0]['timestamp'] == datetime(2024, 1, 1).timestamp()
+        finally:
+            cm.close()
+
+        assert not legacy_file.exists()
+        assert (tmp_path / 'cache_queue.json.migrated').exists()
+
+    def test_imports_only_once(self, tmp_path):
+        """Test a legacy file is ignored once the database has entries"""
+        first = make_file(tmp_path, 'first.mp4')
+        write_legacy_queue(tmp_path, [{'file_path': first, 'content_type': 'video'}])
+        CacheManager(cache_dir=str(tmp_path)).close()
+
+        second = make_file(tmp_path, 'second.mp4')
+        legacy_file = write_legacy_queue(tmp_path, [{'file_path': second, 'content_type': 'video'}])
+
+        cm = CacheManager(cache_dir=str(tmp_path))
+        try:
+            assert [entry['file_path'] for entry in cm.get_cache_queue()] == [first]
+        finally:
+            cm.close()
+
+        assert legacy_file.exists()
+
+
+class TestQueueOrder:
+    """Tests for the queue order"""
+
+    def test_order_preserved_across_reopen(self, tmp_path):
+        """Test the queue reloads oldest first, with re-cached paths last"""
+        paths = [make_file(tmp_path, f'{name}.mp4') for name in ('a', 'b', 'c')]
+
+        cm = CacheManager(cache_dir=str(tmp_path))
+        for path in paths:
+            assert cm.add_to_cache(path, path, 'video')
+        assert cm.add_to_cache(paths[0], paths[0], 'video')
+        expected = [paths[1], paths[2], paths[0]]
+        assert [entry['file_path'] for entry in cm.get_cache_queue()] == expected
+        cm.close()
+
+        cm = CacheManager(cache_dir=str(tmp_path))
+        try:
+            assert [entry['file_path'] for entry in cm.get_cache_queue()] == expected
+            assert cm.get_next_cache_item()['file_path'] == paths[1]
+        finally:
+            cm.close()
+
+    def test_timestamps_are_epoch_seconds(self, manager, tmp_path):
+        """Test entries are stamped with a float epoch, not a string"""
+        path = make_file(tmp_path, 'a.mp4')
+        manager.add_to_cache(path, 'a.mp4', 'video')
+
+        timestamp = manager.get_next_cache_item()['timestamp']
+        assert isinstance(timestamp, float)
+        assert abs(timestamp - datetime.now().timestamp()) < 60
+
+    def test_add_missing_file_fails(self, manager, tmp_path):
+        """Test a path that does not exist is not queued"""
+        assert not manager.add_to_cache(str(tmp_path / 'missing.mp4'), 'missing.mp4', 'video')
+        assert len(manager) == 0
+
+
+class TestReadOnlyEntries:
+    """Tests for the read-only entries handed out by the manager"""
+
+    def test_metadata_is_frozen(self, manager, tmp_path):
+        """Test neither callers nor the original dict can change metadata"""
+        path = make_file(tmp_path, 'a.mp4')
+        metadata = {'remote_path': '/YTBot/a.mp4'}
+        manager.add_to_cache(path, 'a.mp4', 'video', metadata=metadata)
+        metadata['remote_path'] = '/elsewhere'
+
+        entry = manager.get_cache_item_by_path(path)
+        assert entry['metadata']['remote_path'] == '/YTBot/a.mp4'
+        with pytest.raises(TypeError):
+            entry['metadata']['remote_path'] = '/elsewhere'
+        with pytest.raises(TypeError):
+            entry['size'] = 0
+
+    def test_to_dict_is_serializable(self, manager, tmp_path):
+        """Test to_dict returns a plain copy json.dumps accepts"""
+        path = make_file(tmp_path, 'a.mp4')
+        manager.add_to_cache(path, 'a.mp4', 'video', metadata={'is_directory': False})
+
+        copy = CacheManager.to_dict(manager.get_next_cache_item())
+        copy['metadata']['extra'] = 1
+
+        assert json.loads(json.dumps(copy))['metadata'] == {'is_directory': False, 'extra': 1}
+        assert 'extra' not in manager.get_next_cache_item()['metadata']
+
+
+class TestRemoveMany:
+    """Tests for remove_many"""
+
+    def test_removes_present_and_skips_missing(self, manager, tmp_path):
+        """Test only queued paths are removed and counted"""
+        paths = [make_file(tmp_path, f'{name}.mp4') for name in ('a', 'b', 'c')]
+        for path in paths:
+            manager.add_to_cache(path, path, 'video')
+
+        removed = manager.remove_many([paths[0], paths[2], str(tmp_path / 'unknown.mp4')])
+
+        assert removed == 2
+        assert [entry['file_path'] for entry in manager.get_cache_queue()] == [paths[1]]
+        assert manager.get_items_by_content_type('video') == manager.get_cache_queue()
+
+    def test_removal_persists(self, tmp_path):
+        """Test removed entries stay gone after reopening"""
+        paths = [make_file(tmp_path, f'{name}.mp4') for name in ('a', 'b')]
+        cm = CacheManager(cache_dir=str(tmp_path))
+        for path in paths:
+            cm.add_to_cache(path, path, 'video')
+        cm.remove_many([paths[0]])
+        cm.close()
+
+        cm = CacheManager(cache_dir=str(tmp_path))
+        try:
+            assert [entry['file_path'] for entry in cm.get_cache_queue()] == [paths[1]]
+        finally:
+            cm.close()
+
+    def test_empty_input(self, manager):
+        """Test removing nothing returns 0"""
+        assert manager.remove_many([]) == 0
+
+
+class TestGetCacheManager:
+    """Tests for the global cache manager"""
+
+    def test_created_lazily_and_reused(self, tmp_path, monkeypatch):
+        """Test the instance is built on first call and then shared"""
+        monkeypatch.setattr(cache_manager_module, '_cache_manager', None)
+        monkeypatch.setattr(
+            cache_manager_module, 'CacheManager',
+            lambda: CacheManager(cache_dir=str(tmp_path))
+        )
+
+        assert not (tmp_path / 'cache_queue.db').exists()
+
+        cm = get_cache_manager()
+        try:
+            assert cm is get_cache_manager()
+            assert cm.cache_dir == tmp_path
+            assert (tmp_path / 'cache_queue.db').exists()
+        finally:
+            cm.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
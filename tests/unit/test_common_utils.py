@@ -24,6 +24,7 @@ from ytbot.utils.common import (
     chunk_list,
     deep_merge,
     mask_sensitive_data,
+    TTLCache,
 )
 
 
@@ -44,6 +45,10 @@ class TestSanitizeFilename:
         """Test handling of multiple spaces"""
         assert sanitize_filename('file   name.txt') == 'file name.txt'
     
+    def test_collapses_other_whitespace(self):
+        """Test tabs and newlines collapse to single spaces"""
+        assert sanitize_filename('file\t\n name.txt') == 'file name.txt'
+    
     def test_trims_whitespace(self):
         """Test trimming of whitespace"""
         assert sanitize_filename('  filename.txt  ') == 'filename.txt'
@@ -324,5 +329,52 @@ class TestMaskSensitiveData:
         assert result["config"]["password"] != "secret"
 
 
+class TestTTLCache:
+    """Tests for TTLCache"""
+
+    def test_get_and_set(self):
+        """Test storing and retrieving values"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert cache.get("missing", "default") == "default"
+
+    def test_expiry(self, monkeypatch):
+        """Test entries expire after their TTL"""
+        now = [1000.0]
+        monkeypatch.setattr("ytbot.utils.common.time.monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=1)
+        now[0] += 5
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        now[0] += 10
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted when full"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_pop_and_clear(self):
+        """Test removing entries"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -121,6 +121,9 @@ class TestTelegramConfig:
             assert config.token == ''
             assert config.admin_chat_id == ''
             assert config.allowed_chat_ids == []
+            assert config.pool_size == 32
+            assert config.get_updates_pool_size == 4
+            assert config.concurrent_updates == 1
     
     def test_allowed_chat_ids_with_admin(self):
         """Test allowed_chat_ids property"""
@@ -0,0 +1,56 @@
+"""
+Unit tests for the download service
+"""
+
+import pytest
+
+from ytbot.services.download_service import DownloadService
+
+
+@pytest.fixture(scope='module')
+def service():
+    """Download service with the default platform handlers"""
+    return DownloadService()
+
+
+class TestGetHandler:
+    """Tests for the host-based handler lookup"""
+
+    @pytest.mark.parametrize('url, platform', [
+        ('https://x.com/user/status/123', 'Twitter/X'),
+        ('https://twitter.com/user/status/123', 'Twitter/X'),
+        ('https://mobile.twitter.com/user/status/123', 'Twitter/X'),
+        ('https://www.youtube.com/watch?v=dQw4w9WgXcQ', 'YouTube'),
+        ('https://youtu.be/dQw4w9WgXcQ', 'YouTube'),
+    ])
+    def test_matches_platform_hosts(self, service, url, platform):
+        """Test supported hosts map to their platform handler"""
+        handler = service.get_handler(url)
+        assert handler is not None
+        assert handler.name == platform
+
+    def test_host_case_is_ignored(self, service):
+        """Test an upper-case host still matches"""
+        assert service.get_handler('HTTPS://X.COM/user/status/123').name == 'Twitter/X'
+
+    def test_domain_outside_host_does_not_match(self, service):
+        """Test a platform domain in the query string is not enough"""
+        assert service.get_handler('https://example.com/?u=x.com/user') is None
+
+    def test_unknown_host_and_non_url(self, service):
+        """Test unsupported hosts and plain text get no handler"""
+        assert service.get_handler('https://example.com/video') is None
+        assert service.get_handler('not a url') is None
+
+    def test_lookup_is_cached_per_host(self, service):
+        """Test URLs on the same host share one cached match"""
+        service._handler_for_host.cache_clear()
+        service.get_handler('https://x.com/a/status/1')
+        service.get_handler('https://x.com/b/status/2')
+        info = service._handler_for_host.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
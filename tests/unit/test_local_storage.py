@@ -0,0 +1,54 @@
+"""
+Unit tests for local storage helpers
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from ytbot.storage import local_storage
+from ytbot.storage.local_storage import _copy_file
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, 'copy_file_range'), reason="copy_file_range not available"
+)
+
+
+class TestCopyFile:
+    """Tests for _copy_file"""
+
+    def test_copies_content(self, tmp_path):
+        """Test a normal copy keeps the content"""
+        source = tmp_path / 'source.bin'
+        target = tmp_path / 'target.bin'
+        source.write_bytes(b'x' * 10000)
+
+        _copy_file(source, target)
+
+        assert target.read_bytes() == b'x' * 10000
+
+    def test_falls_back_when_nothing_copied(self, tmp_path):
+        """Test copy_file_range returning 0 up front falls back to shutil"""
+        source = tmp_path / 'source.bin'
+        target = tmp_path / 'target.bin'
+        source.write_bytes(b'data' * 100)
+
+        with patch.object(local_storage.os, 'copy_file_range', return_value=0):
+            _copy_file(source, target)
+
+        assert target.read_bytes() == b'data' * 100
+
+    def test_raises_on_partial_copy(self, tmp_path):
+        """Test copy_file_range stopping midway is an error, not a success"""
+        source = tmp_path / 'source.bin'
+        target = tmp_path / 'target.bin'
+        source.write_bytes(b'data' * 100)
+
+        with patch.object(local_storage.os, 'copy_file_range', side_effect=[100, 0]):
+            with pytest.raises(OSError):
+                _copy_file(source, target)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,85 @@
+"""
+Unit tests for the X-to-Notion extraction script
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parents[2]
+    / 'ytbot' / 'x_content_extractor' / 'x_to_notion_with_real_content.py'
+)
+
+
+@pytest.fixture
+def script():
+    """Load the standalone script as a module"""
+    spec = importlib.util.spec_from_file_location('x_to_notion_with_real_content', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def extractor():
+    """Mocked TwitterContentExtractor instance, patched in for the in-process path"""
+    instance = MagicMock()
+    instance.scrape_tweet = AsyncMock()
+    instance.close_browser = AsyncMock()
+    with patch('ytbot.platforms.twitter.PLAYWRIGHT_AVAILABLE', True), \
+            patch('ytbot.platforms.twitter.TwitterContentExtractor', return_value=instance), \
+            patch.dict(sys.modules, {
+                'ytbot.core.browser_manager': MagicMock(shutdown_browser=AsyncMock())
+            }):
+        yield instance
+
+
+class TestExtractContent:
+    """Tests for extract_content"""
+
+    def test_uses_in_process_extractor(self, script, extractor):
+        """Test a successful in-process scrape skips the Node scraper"""
+        extractor.scrape_tweet.return_value = {'success': True, 'title': 'T', 'content': 'C'}
+
+        with patch.object(script, 'extract_content_with_js') as js:
+            assert script.extract_content('https://x.com/a/status/1') == ('T', 'C')
+
+        js.assert_not_called()
+        extractor.scrape_tweet.assert_awaited_once_with('https://x.com/a/status/1')
+        extractor.close_browser.assert_awaited_once()
+
+    def test_falls_back_when_scrape_fails(self, script, extractor):
+        """Test an unsuccessful in-process scrape falls back to the Node scraper"""
+        extractor.scrape_tweet.return_value = {'success': False, 'error': 'blocked'}
+
+        with patch.object(script, 'extract_content_with_js', return_value=('A', 'B')) as js:
+            assert script.extract_content('https://x.com/a/status/1') == ('A', 'B')
+
+        js.assert_called_once_with('https://x.com/a/status/1')
+        extractor.close_browser.assert_awaited_once()
+
+    def test_falls_back_when_scrape_raises(self, script, extractor):
+        """Test an in-process scrape error falls back to the Node scraper"""
+        extractor.scrape_tweet.side_effect = RuntimeError("browser crashed")
+
+        with patch.object(script, 'extract_content_with_js', return_value=('A', 'B')) as js:
+            assert script.extract_content('https://x.com/a/status/1') == ('A', 'B')
+
+        js.assert_called_once_with('https://x.com/a/status/1')
+
+    def test_uses_node_scraper_without_playwright(self, script):
+        """Test the Node scraper is used when Python Playwright is missing"""
+        with patch('ytbot.platforms.twitter.PLAYWRIGHT_AVAILABLE', False), \
+                patch.object(script, 'extract_content_with_js', return_value=('A', 'B')) as js:
+            assert script.extract_content('https://x.com/a/status/1') == ('A', 'B')
+
+        js.assert_called_once_with('https://x.com/a/status/1')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -6,7 +6,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 import asyncio
 
-from ytbot.platforms.youtube import YouTubeHandler
+from ytbot.platforms.youtube import YouTubeHandler, _ProgressRelay
 from ytbot.core.types import ContentType, ContentInfo, DownloadResult
 
 
@@ -47,7 +47,14 @@ class TestYouTubeHandler:
         
         for url in non_youtube_urls:
             assert not handler.can_handle(url), f"Should not handle: {url}"
-    
+
+    def test_can_handle_is_anchored(self, handler):
+        """Test can_handle only matches YouTube hosts at the start of the URL"""
+        assert handler.can_handle("https://m.youtube.com/watch?v=dQw4w9WgXcQ")
+        assert handler.can_handle("https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ")
+        assert not handler.can_handle("https://example.com/redirect?to=youtube.com/watch")
+        assert not handler.can_handle("https://example.com/" + "youtube." * 5000)
+
     def test_is_playlist(self, handler):
         """Test is_playlist detection"""
         playlist_urls = [
@@ -155,6 +162,7 @@ class TestYouTubeHandler:
         assert 'outtmpl' in opts
         assert 'format' in opts
         assert 'merge_output_format' in opts
+        assert opts['buffersize'] == handler.config.download.buffer_size
     
     def test_setup_download_options_with_format_id(self, handler):
         """Test download options with specific format ID"""
@@ -184,6 +192,16 @@ class TestYouTubeHandler:
         result = handler._find_downloaded_file(str(tmp_path), ContentType.VIDEO)
         assert result == video_file
     
+    def test_find_downloaded_file_prefers_extension_order(self, handler, tmp_path):
+        """Test preferred extension wins over other candidates"""
+        (tmp_path / "test.webm").write_text("mock video")
+        (tmp_path / "test.part").write_text("partial")
+        mp4_file = tmp_path / "test.mp4"
+        mp4_file.write_text("mock video")
+
+        result = handler._find_downloaded_file(str(tmp_path), ContentType.VIDEO)
+        assert result == mp4_file
+
     def test_find_downloaded_file_not_found(self, handler, tmp_path):
         """Test finding file when none exists"""
         result = handler._find_downloaded_file(str(tmp_path), ContentType.VIDEO)
@@ -258,8 +276,168 @@ class TestYouTubeHandlerAsync:
             assert result is None
     
     @pytest.mark.asyncio
-    async def test_get_format_list_fallback(self, handler):
-        """Test fallback format list retrieval"""
+    async def test_get_content_info_cached(self, handler):
+        """Test repeated content info lookups reuse the extracted result"""
+        mock_info = {'title': 'Cached Video', 'formats': []}
+
+        with patch('yt_dlp.YoutubeDL') as mock_ydl:
+            mock_ydl_instance = MagicMock()
+            mock_ydl_instance.extract_info.return_value = mock_info
+            mock_ydl.return_value.__enter__.return_value = mock_ydl_instance
+
+            first = await handler.get_content_info("https://youtube.com/watch?v=cached")
+            second = await handler.get_content_info("https://youtube.com/watch?v=cached")
+
+            assert first is second
+            assert mock_ydl_instance.extract_info.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_format_list_cached(self, handler):
+        """Test repeated format list lookups reuse the extracted result"""
+        result = ({'title': 'Test'}, [{'format_id': '137'}])
+
+        with patch.object(handler, '_extract_format_list', return_value=result) as mock_extract:
+            assert await handler.get_format_list("https://youtube.com/watch?v=test") == result
+            assert await handler.get_format_list("https://youtube.com/watch?v=test") == result
+            assert mock_extract.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_format_list_coalesces_concurrent_calls(self, handler):
+        """Test concurrent format list lookups share one extraction"""
+        result = ({'title': 'Test'}, [{'format_id': '137'}])
+        calls = 0
+
+        async def slow_extract(url):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return result
+
+        with patch.object(handler, '_extract_format_list', side_effect=slow_extract):
+            results = await asyncio.gather(*[
+                handler.get_format_list("https://youtube.com/watch?v=burst")
+                for _ in range(5)
+            ])
+
+        assert all(r == result for r in results)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_progress_relay_reports_latest_event(self):
+        """Test progress events from a worker thread reach the async callback"""
+        received = []
+
+        async def callback(d):
+            received.append(d['downloaded_bytes'])
+
+        relay = _ProgressRelay(callback, asyncio.get_running_loop())
+        task = asyncio.create_task(relay.run())
+
+        def emit():
+            for i in range(200):
+                relay.hook({'status': 'downloading', 'downloaded_bytes': i})
+            relay.hook({'status': 'finished', 'downloaded_bytes': 200})
+
+        await asyncio.to_thread(emit)
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        assert received
+        assert received[-1] == 200
+        assert received == sorted(received)
+
+    @pytest.mark.asyncio
+    async def test_progress_relay_close_reports_final_event(self):
+        """Test close() lets run() deliver the last queued event and return"""
+        received = []
+
+        async def callback(d):
+            received.append(d['status'])
+
+        relay = _ProgressRelay(callback, asyncio.get_running_loop())
+        task = asyncio.create_task(relay.run())
+
+        def emit():
+            relay.hook({'status': 'downloading'})
+            relay.hook({'status': 'finished'})
+
+        await asyncio.to_thread(emit)
+        relay.close()
+        await asyncio.wait_for(task, 1)
+
+        assert received[-1] == 'finished'
+
+    def test_progress_relay_throttles_downloading_events(self):
+        """Test 'downloading' events are rate limited in the download thread"""
+        loop = MagicMock()
+        relay = _ProgressRelay(MagicMock(), loop)
+
+        for i in range(100):
+            relay.hook({'status': 'downloading', 'downloaded_bytes': i})
+        relay.hook({'status': 'finished'})
+
+        assert loop.call_soon_threadsafe.call_count == 2
+
+    def test_run_download_reuses_cached_info(self, handler):
+        """Test a cached format-list extraction is processed without re-extracting"""
+        url = "https://www.youtube.com/watch?v=test"
+        info = {'id': 'test', 'title': 'Test', 'formats': [{'format_id': '18'}]}
+        handler._info_cache.set((url, "formats"), (info, info['formats']))
+
+        cached_info = handler._get_cached_video_info(url)
+        assert cached_info is info
+
+        ydl = MagicMock()
+        ydl.process_ie_result.side_effect = lambda i, download: i
+        result = handler._run_download(ydl, url, cached_info)
+        assert result == info
+        assert result is not info
+        ydl.process_ie_result.assert_called_once()
+        ydl.extract_info.assert_not_called()
+
+    def test_run_download_falls_back_to_extraction(self, handler):
+        """Test a rejected cached info dict falls back to a fresh extraction"""
+        import yt_dlp
+
+        url = "https://www.youtube.com/watch?v=test"
+        info = {'id': 'test', 'formats': [{'format_id': '18'}]}
+        handler._info_cache.set((url, "formats"), (info, info['formats']))
+
+        ydl = MagicMock()
+        ydl.process_ie_result.side_effect = yt_dlp.utils.DownloadError("HTTP Error 403")
+        ydl.extract_info.return_value = {'id': 'test'}
+
+        assert handler._run_download(ydl, url, dict(info)) == {'id': 'test'}
+        ydl.extract_info.assert_called_once_with(url, download=True)
+        assert handler._get_cached_video_info(url) is None
+
+    def test_run_download_cached_info_ignores_ignoreerrors(self, handler):
+        """Test the cached-info attempt raises even when ignoreerrors is set"""
+        url = "https://www.youtube.com/watch?v=test"
+        info = {'id': 'test', 'formats': [{'format_id': '18'}]}
+        handler._info_cache.set((url, "formats"), (info, info['formats']))
+
+        ydl = MagicMock()
+        ydl.params = {'ignoreerrors': True}
+        seen = []
+
+        def process(i, download):
+            seen.append(ydl.params['ignoreerrors'])
+            return None
+
+        ydl.process_ie_result.side_effect = process
+        ydl.extract_info.side_effect = lambda u, download: (
+            seen.append(ydl.params['ignoreerrors']) or {'id': 'test'}
+        )
+
+        assert handler._run_download(ydl, url, dict(info)) == {'id': 'test'}
+        assert seen == [False, True]
+        assert ydl.params['ignoreerrors'] is True
+        assert handler._get_cached_video_info(url) is None
+
+    @pytest.mark.asyncio
+    async def test_extract_format_list(self, handler):
+        """Test format list retrieval through the yt-dlp Python API"""
         mock_info = {
             'title': 'Test',
             'formats': [
@@ -273,7 +451,7 @@ class TestYouTubeHandlerAsync:
             mock_ydl_instance.extract_info.return_value = mock_info
             mock_ydl.return_value.__enter__.return_value = mock_ydl_instance
             
-            video_info, formats = await handler._get_format_list_fallback("https://youtube.com/watch?v=test")
+            video_info, formats = await handler._extract_format_list("https://youtube.com/watch?v=test")
             
             assert video_info is not None
             assert len(formats) == 2
@@ -72,7 +72,9 @@ class YTBot:
         logger.info("🔄 Initializing additional services...")
 
         # Initialize DownloadService
-        self.download_service = DownloadService()
+        self.download_service = DownloadService(
+            temp_root=self.storage_service.preferred_temp_dir if self.storage_service else None
+        )
         logger.info("✅ DownloadService initialized")
 
         # Initialize UserStateManager
@@ -130,7 +132,7 @@ class YTBot:
         if self.storage_service:
             storage_info = (
                 'Nextcloud + Local'
-                if self.storage_service.nextcloud_available else 'Local only'
+                if await self.storage_service.ensure_nextcloud_available() else 'Local only'
             )
             logger.info(f"💾 Storage: {storage_info}")
 
@@ -323,7 +325,7 @@ class YTBot:
             if self.storage_service:
                 storage_info = (
                     'Nextcloud + 本地存储'
-                    if self.storage_service.nextcloud_available else '仅本地存储'
+                    if await self.storage_service.ensure_nextcloud_available() else '仅本地存储'
                 )
                 if self.storage_service.local_storage:
                     local_space_mb = self.storage_service.local_storage.get_available_space_mb()
@@ -113,6 +113,28 @@ class TelegramConfig:
     """Telegram Bot configuration"""
     token: str = field(default_factory=lambda: get_env_str("TELEGRAM_BOT_TOKEN"))
     admin_chat_id: str = field(default_factory=lambda: get_env_str("ADMIN_CHAT_ID"))
+    pool_size: int = field(default_factory=lambda: get_env_int("TELEGRAM_POOL_SIZE", 32, min_value=1))
+    pool_timeout: float = field(default_factory=lambda: get_env_float("TELEGRAM_POOL_TIMEOUT", 10.0, min_value=0))
+    connect_timeout: float = field(default_factory=lambda: get_env_float("TELEGRAM_CONNECT_TIMEOUT", 10.0, min_value=0))
+    read_timeout: float = field(default_factory=lambda: get_env_float("TELEGRAM_READ_TIMEOUT", 30.0, min_value=0))
+    get_updates_pool_size: int = field(
+        default_factory=lambda: get_env_int("TELEGRAM_GET_UPDATES_POOL_SIZE", 4, min_value=1)
+    )
+    get_updates_pool_timeout: float = field(
+        default_factory=lambda: get_env_float("TELEGRAM_GET_UPDATES_POOL_TIMEOUT", 60.0, min_value=0)
+    )
+    get_updates_connect_timeout: float = field(
+        default_factory=lambda: get_env_float("TELEGRAM_GET_UPDATES_CONNECT_TIMEOUT", 10.0, min_value=0)
+    )
+    get_updates_read_timeout: float = field(
+        default_factory=lambda: get_env_float("TELEGRAM_GET_UPDATES_READ_TIMEOUT", 30.0, min_value=0)
+    )
+    rate_limit: bool = field(default_factory=lambda: get_env_bool("TELEGRAM_RATE_LIMIT", True))
+    concurrent_updates: int = field(default_factory=lambda: get_env_int("TELEGRAM_CONCURRENT_UPDATES", 1, min_value=1))
+    webhook_url: str = field(default_factory=lambda: get_env_str("TELEGRAM_WEBHOOK_URL"))
+    webhook_listen: str = field(default_factory=lambda: get_env_str("TELEGRAM_WEBHOOK_LISTEN", "0.0.0.0"))
+    webhook_port: int = field(default_factory=lambda: get_env_int("TELEGRAM_WEBHOOK_PORT", 8443, min_value=1))
+    webhook_secret: str = field(default_factory=lambda: get_env_str("TELEGRAM_WEBHOOK_SECRET"))
     
     @property
     def allowed_chat_ids(self) -> List[str]:
@@ -137,6 +159,7 @@ class NextcloudConfig:
     upload_retry_delay: float = field(default_factory=lambda: get_env_float("NEXTCLOUD_UPLOAD_RETRY_DELAY", 5.0, min_value=0))
     upload_timeout: int = field(default_factory=lambda: get_env_int("NEXTCLOUD_UPLOAD_TIMEOUT", 600, min_value=1))
     verify_file_size: bool = field(default_factory=lambda: get_env_bool("NEXTCLOUD_VERIFY_FILE_SIZE", True))
+    parallel_uploads: int = field(default_factory=lambda: get_env_int("NEXTCLOUD_PARALLEL_UPLOADS", 4, min_value=1))
 
 
 @dataclass(frozen=True)
@@ -147,6 +170,7 @@ class LocalStorageConfig:
     max_size_mb: int = field(default_factory=lambda: get_env_int("LOCAL_STORAGE_MAX_SIZE_MB", 10240, min_value=0))
     cleanup_after_days: int = field(default_factory=lambda: get_env_int("LOCAL_STORAGE_CLEANUP_AFTER_DAYS", 7, min_value=0))
     delete_after_upload: bool = field(default_factory=lambda: get_env_bool("LOCAL_STORAGE_DELETE_AFTER_UPLOAD", False))
+    io_concurrency: int = field(default_factory=lambda: get_env_int("LOCAL_STORAGE_IO_CONCURRENCY", 4, min_value=1))
 
 
 @dataclass(frozen=True)
@@ -184,6 +208,7 @@ class DownloadConfig:
     max_sleep_interval: float = field(default_factory=lambda: get_env_float("MAX_SLEEP_INTERVAL", 10.0, min_value=0))
     socket_timeout: int = field(default_factory=lambda: get_env_int("DOWNLOAD_SOCKET_TIMEOUT", 20, min_value=1))
     progress_update_interval: int = field(default_factory=lambda: get_env_int("PROGRESS_UPDATE_INTERVAL", 10, min_value=1))
+    buffer_size: int = field(default_factory=lambda: get_env_int("DOWNLOAD_BUFFER_SIZE", 1024 * 1024, min_value=1024))
     
     @property
     def http_headers(self) -> Dict[str, str]:
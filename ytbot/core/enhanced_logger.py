@@ -65,6 +65,8 @@ class YTBotLogger:
 
     def debug(self, msg: str, *args, **kwargs):
         """Debug level logging with extra context"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         extra = kwargs.get('extra', {})
         extra.update(self._get_context_info())
         kwargs['extra'] = extra
@@ -72,6 +74,8 @@ class YTBotLogger:
 
     def info(self, msg: str, *args, **kwargs):
         """Info level logging with extra context"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         extra = kwargs.get('extra', {})
         extra.update(self._get_context_info())
         kwargs['extra'] = extra
@@ -79,6 +83,8 @@ class YTBotLogger:
 
     def warning(self, msg: str, *args, **kwargs):
         """Warning level logging with extra context"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         extra = kwargs.get('extra', {})
         extra.update(self._get_context_info())
         kwargs['extra'] = extra
@@ -109,6 +115,10 @@ class YTBotLogger:
         kwargs['extra'] = extra
         self.logger.exception(msg, *args, **kwargs)
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a record at this level would be emitted"""
+        return self.logger.isEnabledFor(level)
+
     def _get_context_info(self) -> Dict[str, Any]:
         """Get additional context information for logging"""
         try:
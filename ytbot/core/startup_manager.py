@@ -4,6 +4,7 @@ Startup Manager for YTBot
 Manages the startup sequence with phase tracking, error handling, and rollback capabilities.
 """
 
+import asyncio
 import os
 import platform
 import shutil
@@ -548,10 +549,10 @@ class StartupManager:
         logger.info("💾 Initializing local storage...")
 
         try:
-            from ..storage.local_storage import LocalStorageManager
+            from ..storage.local_storage import local_storage_manager
 
-            # Create local storage manager
-            local_storage = LocalStorageManager()
+            # Use the shared local storage manager
+            local_storage = local_storage_manager
             self.services['local_storage'] = local_storage
 
             if not local_storage.enabled:
@@ -598,12 +599,10 @@ class StartupManager:
             local_storage = self.services['local_storage']
             storage_path = local_storage.storage_path
 
-            # Find cached files
+            # Find cached files (one scandir pass, stat results included)
             cached_files = []
             if storage_path.exists():
-                for file_path in storage_path.rglob('*'):
-                    if file_path.is_file():
-                        cached_files.append(file_path)
+                cached_files = await asyncio.to_thread(local_storage.list_stored_files)
 
             if cached_files:
                 count = len(cached_files)
@@ -612,9 +611,9 @@ class StartupManager:
                 logger.info(f"💡 {msg}")
 
                 # Log file details
-                for i, file_path in enumerate(cached_files[:5]):
-                    file_size = file_path.stat().st_size / (1024 * 1024)
-                    logger.info(f"  {i + 1}. {file_path.name} ({file_size:.2f} MB)")
+                for i, (file_path, file_stat) in enumerate(cached_files[:5]):
+                    file_size = file_stat.st_size / (1024 * 1024)
+                    logger.info(f"  {i + 1}. {os.path.basename(file_path)} ({file_size:.2f} MB)")
 
                 if len(cached_files) > 5:
                     remaining = len(cached_files) - 5
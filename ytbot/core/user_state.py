@@ -415,7 +415,7 @@ class UserStateManager:
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+                json.dump(save_data, f, ensure_ascii=False, separators=(',', ':'))
 
             logger.debug(f"Saved {len(save_data)} user states to {self.persistence_file}")
             return True
@@ -255,7 +255,7 @@ class TelegramHandler:
         is_url = self._is_url(message_text)
 
         # Match handler only once and reuse the result
-        handler = self.download_service.platform_manager.get_handler(message_text)
+        handler = self.download_service.get_handler(message_text)
         can_handle = handler is not None
 
         logger.info("🔍 URL analysis results:")
@@ -683,7 +683,7 @@ class TelegramHandler:
 
             # Use the already-matched handler if provided
             if handler is None:
-                handler = self.download_service.platform_manager.get_handler(url)
+                handler = self.download_service.get_handler(url)
 
             if handler:
                 logger.info("✅ Link type identified: %s", handler.name)
@@ -1130,7 +1130,7 @@ class TelegramHandler:
         try:
             # Use the already-matched handler if provided
             if handler is None:
-                handler = self.download_service.platform_manager.get_handler(url)
+                handler = self.download_service.get_handler(url)
 
             if not handler:
                 await self.telegram_service.edit_message(
@@ -1252,7 +1252,8 @@ class TelegramHandler:
                 storage_result = await self._store_downloaded_file(
                     download_result.file_path,
                     title,
-                    actual_download_type
+                    actual_download_type,
+                    move=bool(download_result.temp_dir)
                 )
 
                 if storage_result['success']:
@@ -1351,7 +1352,8 @@ class TelegramHandler:
         self,
         file_path: str,
         title: str,
-        download_type: str
+        download_type: str,
+        move: bool = False
     ) -> Dict[str, Any]:
         """
         Store the downloaded file.
@@ -1360,6 +1362,7 @@ class TelegramHandler:
             file_path: Path to downloaded file or directory
             title: Content title
             download_type: "audio" or "video"
+            move: The file is a disposable temp file and may be moved
 
         Returns:
             Storage result dictionary
@@ -1380,7 +1383,9 @@ class TelegramHandler:
 
             safe_filename = sanitize_filename(f"{title}{ext}")
 
-        return await self.storage_service.store_file(file_path, safe_filename, download_type)
+        return await self.storage_service.store_file(
+            file_path, safe_filename, download_type, move=move
+        )
 
     async def _send_success_message(
         self,
@@ -1569,7 +1574,7 @@ class TelegramHandler:
         format_id = state_data['format_id']
         message_id = state_data['message_id']
 
-        handler = self.download_service.platform_manager.get_handler(url)
+        handler = self.download_service.get_handler(url)
 
         if not handler:
             await self.telegram_service.edit_message(
@@ -1610,7 +1615,8 @@ class TelegramHandler:
                 storage_result = await self._store_downloaded_file(
                     download_result.file_path,
                     title,
-                    download_type
+                    download_type,
+                    move=bool(download_result.temp_dir)
                 )
 
                 if storage_result['success']:
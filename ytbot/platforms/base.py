@@ -25,6 +25,8 @@ class PlatformHandler(ABC):
     def __init__(self, name: str) -> None:
         self.name: str = name
         self.supported_content_types: List[ContentType] = []
+        # Parent directory for download temp dirs (None = system default)
+        self.temp_root: Optional[str] = None
 
     @abstractmethod
     def can_handle(self, url: str) -> bool:
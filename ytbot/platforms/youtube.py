@@ -5,12 +5,14 @@ Handles YouTube video and playlist downloads with support for various formats an
 """
 
 import re
+import copy
+import time
 import asyncio
 import shutil
 import tempfile
 import json
 import os
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from pathlib import Path
 
 import yt_dlp
@@ -19,9 +21,107 @@ from .base import PlatformHandler
 from ..core.logger import get_logger
 from ..core.config import get_config
 from ..core.types import ContentType, ContentInfo, DownloadResult, JSONDict
+from ..utils.common import TTLCache
+from ..utils.async_utils import SingleFlight
 
 logger = get_logger(__name__)
 
+# Anchored, non-capturing so validation cost is bounded by the host prefix
+_YT_URL_RE = re.compile(
+    r'^(?:https?://)?(?:(?:www|m|music)\.)?'
+    r'(?:youtube(?:-nocookie)?\.com|youtu\.be)/'
+)
+_LIST_PARAM_RE = re.compile(r'[?&]list=([A-Za-z0-9_-]+)')
+
+# Extraction results are reused for this long; failures are retried sooner
+INFO_CACHE_MAXSIZE = 512
+INFO_CACHE_TTL = 1800
+INFO_CACHE_NEGATIVE_TTL = 60
+
+# Preferred audio format ids: 251 (opus 160kbps) before 140 (m4a 128kbps)
+_AUDIO_PRIORITY_RANK = {'251': 0, '140': 1}
+
+# Downloaded file extensions in order of preference
+_AUDIO_EXT_RANK = {'mp3': 0, 'm4a': 1, 'wav': 2, 'ogg': 3}
+_VIDEO_EXT_RANK = {'mp4': 0, 'mkv': 1, 'webm': 2, 'avi': 3}
+
+# Pending progress events kept per download; older ones are dropped first
+PROGRESS_QUEUE_MAXSIZE = 64
+
+# Minimum seconds between 'downloading' events handed to the event loop
+PROGRESS_MIN_INTERVAL = 0.25
+
+# Seconds a finished download waits for its last progress events to be reported
+PROGRESS_DRAIN_TIMEOUT = 5.0
+
+# Queued after the last event to tell _ProgressRelay.run to finish
+_PROGRESS_DONE = object()
+
+
+class _ProgressRelay:
+    """
+    Forward yt-dlp progress events from the download thread to an async callback.
+
+    The hook only schedules an enqueue on the event loop and never waits; a single
+    consumer task reports the most recent event, so a slow callback cannot stall
+    the download thread. 'downloading' events are throttled in the download thread
+    so a fast download does not flood the loop; all other events always pass.
+    """
+
+    def __init__(self, callback: Callable[[Dict[str, Any]], Any],
+                 loop: asyncio.AbstractEventLoop) -> None:
+        self.callback = callback
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=PROGRESS_QUEUE_MAXSIZE)
+        self._last_sent = float('-inf')
+
+    def hook(self, d: Dict[str, Any]) -> None:
+        """yt-dlp progress hook (called from the download thread)"""
+        if d.get('status') == 'downloading':
+            now = time.monotonic()
+            if now - self._last_sent < PROGRESS_MIN_INTERVAL:
+                return
+            self._last_sent = now
+
+        try:
+            self.loop.call_soon_threadsafe(self._put, d)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+
+    def _put(self, d: Any) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(d)
+
+    def close(self) -> None:
+        """
+        Let run() return once every event hooked so far has been reported
+
+        Scheduled like the hook's own events, so it lands behind any of them
+        still pending on the loop.
+        """
+        self.loop.call_soon_threadsafe(self._put, _PROGRESS_DONE)
+
+    async def run(self) -> None:
+        """Consume queued events, reporting only the latest one each time"""
+        done = False
+        while not done:
+            d = await self.queue.get()
+            done = d is _PROGRESS_DONE
+            while not self.queue.empty():
+                latest = self.queue.get_nowait()
+                if latest is _PROGRESS_DONE:
+                    done = True
+                else:
+                    d = latest
+            if d is _PROGRESS_DONE:
+                continue
+            try:
+                await self.callback(d)
+            except Exception as e:
+                logger.debug(f"Progress callback error: {e}")
+
 
 class YouTubeHandler(PlatformHandler):
     """YouTube platform handler for downloading videos and playlists"""
@@ -30,6 +130,9 @@ class YouTubeHandler(PlatformHandler):
         super().__init__("YouTube")
         self.supported_content_types = [ContentType.VIDEO, ContentType.AUDIO, ContentType.PLAYLIST]
         self.config = get_config()
+        # Keyed by (url, "flat") for content info and (url, "formats") for format lists
+        self._info_cache = TTLCache(maxsize=INFO_CACHE_MAXSIZE, ttl=INFO_CACHE_TTL)
+        self._inflight_formats = SingleFlight()
 
     def _load_youtube_cookies(self) -> Optional[str]:
         """
@@ -136,14 +239,7 @@ class YouTubeHandler(PlatformHandler):
         if not self.validate_url(url):
             return False
 
-        # YouTube URL patterns
-        youtube_patterns = [
-            r'(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/',
-            r'(https?://)?(www\.)?(youtube\.com/playlist)',
-        ]
-
-        url = url.strip()
-        return any(re.search(pattern, url) for pattern in youtube_patterns)
+        return _YT_URL_RE.match(url.strip()) is not None
 
     def is_playlist(self, url: str) -> bool:
         """Check if URL is a YouTube playlist"""
@@ -158,17 +254,25 @@ class YouTubeHandler(PlatformHandler):
         if not self.is_playlist(url):
             return None
 
-        import urllib.parse
-        parsed = urllib.parse.urlparse(url.strip())
-        query_params = urllib.parse.parse_qs(parsed.query)
-
-        if 'list' in query_params:
-            return query_params['list'][0]
-
-        return None
+        match = _LIST_PARAM_RE.search(url.strip())
+        return match.group(1) if match else None
 
     async def get_content_info(self, url: str) -> Optional[ContentInfo]:
         """Get information about the content without downloading"""
+        cache_key = (url, "flat")
+        cached = self._info_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Content info cache hit: {url}")
+            return cached
+
+        content_info = await self._extract_content_info(url)
+        if content_info is not None:
+            ttl = INFO_CACHE_NEGATIVE_TTL if content_info.error_detail else None
+            self._info_cache.set(cache_key, content_info, ttl=ttl)
+        return content_info
+
+    async def _extract_content_info(self, url: str) -> Optional[ContentInfo]:
+        """Run yt-dlp flat extraction for get_content_info"""
         try:
             cookies_path = self._load_youtube_cookies()
 
@@ -316,13 +420,21 @@ class YouTubeHandler(PlatformHandler):
             DownloadResult with download status and file path
         """
         temp_dir = None
+        relay = None
+        progress_task = None
 
         try:
-            temp_dir = tempfile.mkdtemp()
+            temp_dir = tempfile.mkdtemp(dir=self.temp_root)
             logger.info(f"Created temp directory: {temp_dir}")
 
+            progress_hook = None
+            if progress_callback:
+                relay = _ProgressRelay(progress_callback, asyncio.get_running_loop())
+                progress_task = asyncio.create_task(relay.run())
+                progress_hook = relay.hook
+
             ydl_opts = self._setup_download_options(
-                temp_dir, content_type, progress_callback, format_id
+                temp_dir, content_type, progress_hook, format_id
             )
 
             logger.info("🎬 yt-dlp download options:")
@@ -337,8 +449,10 @@ class YouTubeHandler(PlatformHandler):
                 else:
                     logger.info(f"  {key}: {value}")
 
+            known_info = self._get_cached_video_info(url)
+
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = await asyncio.to_thread(ydl.extract_info, url, download=True)
+                info = await asyncio.to_thread(self._run_download, ydl, url, known_info)
 
                 if not info:
                     return DownloadResult(
@@ -401,7 +515,61 @@ class YouTubeHandler(PlatformHandler):
         finally:
             # Note: We don't clean up temp_dir here as the file needs to be available
             # for upload/storage. Cleanup should be handled by the caller.
-            pass
+            if progress_task:
+                # Report the final 'finished' event instead of
+                # cutting the callback off mid-update; give up after a timeout
+                relay.close()
+                try:
+                    await asyncio.wait_for(progress_task, PROGRESS_DRAIN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.debug("Progress relay did not drain in time, cancelled")
+
+    def _get_cached_video_info(self, url: str) -> Optional[JSONDict]:
+        """
+        Get the full video info extracted by get_format_list, if cached.
+
+        The returned dict is shared with the cache and must not be modified.
+        """
+        cached = self._info_cache.get((url, "formats"))
+        if not cached:
+            return None
+
+        info = cached[0]
+        if not info or info.get('_type', 'video') != 'video' or not info.get('formats'):
+            return None
+
+        return info
+
+    def _run_download(
+        self, ydl: yt_dlp.YoutubeDL, url: str, info: Optional[JSONDict] = None
+    ) -> Optional[JSONDict]:
+        """
+        Download url, skipping extraction when pre-extracted info is available.
+
+        Like yt-dlp's --load-info-json: the info dict is processed directly. If the
+        reused info is rejected (e.g. expired stream URLs), fall back to a fresh
+        extraction. Runs in a worker thread, so the (possibly multi-MB) copy of
+        the shared info dict does not block the event loop.
+        """
+        if info is not None:
+            # With ignoreerrors, yt-dlp only reports a rejected download
+            # (e.g. 403 on expired stream URLs); make this attempt raise
+            ignore_errors = ydl.params.get('ignoreerrors')
+            ydl.params['ignoreerrors'] = False
+            try:
+                logger.info("Reusing extracted video info for download")
+                # yt-dlp mutates the info dict; keep the caller's copy intact
+                result = ydl.process_ie_result(copy.deepcopy(info), download=True)
+                if result:
+                    return result
+                logger.warning("Download with cached info returned nothing, re-extracting")
+            except yt_dlp.utils.DownloadError as e:
+                logger.warning(f"Download with cached info failed, re-extracting: {e}")
+            finally:
+                ydl.params['ignoreerrors'] = ignore_errors
+            self._info_cache.pop((url, "formats"))
+
+        return ydl.extract_info(url, download=True)
 
     async def get_supported_formats(self, url: str) -> List[JSONDict]:
         """Get available download formats for the content"""
@@ -432,7 +600,7 @@ class YouTubeHandler(PlatformHandler):
 
     async def get_format_list(self, url: str) -> Tuple[JSONDict, List[JSONDict]]:
         """
-        Get video info and available formats using yt-dlp command line.
+        Get video info and available formats, reusing recent results.
 
         Args:
             url: YouTube video URL
@@ -440,65 +608,28 @@ class YouTubeHandler(PlatformHandler):
         Returns:
             Tuple of (video_info, formats_list)
         """
-        try:
-            cmd = [
-                'yt-dlp',
-                '--flat-playlist',
-                '--dump-json',
-                url
-            ]
-
-            logger.info(f"Getting format list for: {url}")
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=self.config.download.timeout
-                )
-            except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                logger.error("yt-dlp format list command timed out")
-                return await self._get_format_list_fallback(url)
-
-            if process.returncode != 0:
-                logger.error(f"yt-dlp command failed: {stderr.decode()}")
-                return await self._get_format_list_fallback(url)
-
-            output = stdout.decode().strip()
-            if not output:
-                logger.error("yt-dlp returned empty output")
-                return await self._get_format_list_fallback(url)
-
-            try:
-                video_info = json.loads(output)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse yt-dlp JSON output: {e}")
-                return await self._get_format_list_fallback(url)
-
-            if isinstance(video_info, list):
-                video_info = video_info[0] if video_info else {}
-
-            formats = video_info.get('formats', []) if isinstance(video_info, dict) else []
-
-            logger.info(f"Found {len(formats)} formats for video")
-            return video_info, formats
-
-        except Exception as e:
-            logger.error(f"Failed to get format list: {e}")
-            return await self._get_format_list_fallback(url)
+        cache_key = (url, "formats")
+        cached = self._info_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Format list cache hit: {url}")
+            return cached
+
+        return await self._inflight_formats.do(
+            url, lambda: self._load_format_list(url, cache_key)
+        )
 
-    async def _get_format_list_fallback(
-        self, url: str
+    async def _load_format_list(
+        self, url: str, cache_key: Tuple[str, str]
     ) -> Tuple[JSONDict, List[JSONDict]]:
+        """Extract the format list and store it in the info cache"""
+        result = await self._extract_format_list(url)
+        ttl = None if result[1] else INFO_CACHE_NEGATIVE_TTL
+        self._info_cache.set(cache_key, result, ttl=ttl)
+        return result
+
+    async def _extract_format_list(self, url: str) -> Tuple[JSONDict, List[JSONDict]]:
         """
-        Fallback method to get formats using yt-dlp Python API.
+        Get video info and available formats using the yt-dlp Python API.
 
         Args:
             url: YouTube video URL
@@ -507,17 +638,21 @@ class YouTubeHandler(PlatformHandler):
             Tuple of (video_info, formats_list)
         """
         try:
-            cookies_path = self._load_youtube_cookies()
-
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-            }
-
-            if cookies_path:
-                ydl_opts['cookiefile'] = cookies_path
+            logger.info(f"Getting format list for: {url}")
 
             def extract_info():
+                # Cookie loading may parse and convert a JSON cookie file, so it
+                # runs in the worker thread together with the extraction
+                ydl_opts = {
+                    'quiet': True,
+                    'no_warnings': True,
+                    'extract_flat': 'in_playlist',
+                }
+
+                cookies_path = self._load_youtube_cookies()
+                if cookies_path:
+                    ydl_opts['cookiefile'] = cookies_path
+
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                     return ydl.extract_info(url, download=False)
 
@@ -531,10 +666,11 @@ class YouTubeHandler(PlatformHandler):
 
             formats = info.get('formats', []) if isinstance(info, dict) else []
 
+            logger.info(f"Found {len(formats)} formats for video")
             return info, formats
 
         except Exception as e:
-            logger.error(f"Fallback format extraction failed: {e}")
+            logger.error(f"Failed to get format list: {e}")
             return {}, []
 
     def select_best_audio_format(self, formats: List[JSONDict]) -> Optional[str]:
@@ -549,27 +685,30 @@ class YouTubeHandler(PlatformHandler):
         Returns:
             Format ID string or None
         """
-        audio_formats = [
-            f for f in formats
-            if f.get('acodec') != 'none' and f.get('vcodec') == 'none'
-        ]
-
-        if not audio_formats:
+        priority_id = None
+        best_format = None
+        best_abr = -1.0
+
+        for fmt in formats:
+            if fmt.get('acodec') == 'none' or fmt.get('vcodec') != 'none':
+                continue
+            format_id = fmt.get('format_id')
+            rank = _AUDIO_PRIORITY_RANK.get(format_id)
+            if rank is not None and (priority_id is None or rank < _AUDIO_PRIORITY_RANK[priority_id]):
+                priority_id = format_id
+            abr = fmt.get('abr', 0) or 0
+            if abr > best_abr:
+                best_abr, best_format = abr, fmt
+
+        if best_format is None:
             logger.warning("No audio-only formats found")
             return None
 
-        # Priority order for specific format IDs
-        priority_ids = ['251', '140']
-
-        for format_id in priority_ids:
-            for fmt in audio_formats:
-                if fmt.get('format_id') == format_id:
-                    logger.info(f"Selected priority audio format: {format_id}")
-                    return format_id
+        if priority_id is not None:
+            logger.info(f"Selected priority audio format: {priority_id}")
+            return priority_id
 
-        # Fallback: select highest bitrate
-        audio_formats.sort(key=lambda f: f.get('abr', 0) or 0, reverse=True)
-        best_format = audio_formats[0]
+        # Fallback: highest bitrate
         format_id = best_format.get('format_id')
         logger.info(
             f"Selected best bitrate audio format: {format_id} "
@@ -595,38 +734,43 @@ class YouTubeHandler(PlatformHandler):
         Returns:
             Format ID string or None
         """
-        video_formats = [
-            f for f in formats
-            if f.get('vcodec') != 'none' and f.get('acodec') == 'none'
-        ]
-
-        if not video_formats:
+        # Track the best format at or below max_height, and overall as a fallback
+        has_priority = False
+        has_priority_any = False
+        best_suitable = None
+        best_suitable_key = (-1, -1)
+        best_any = None
+        best_any_key = (-1, -1)
+
+        for fmt in formats:
+            if fmt.get('vcodec') == 'none' or fmt.get('acodec') != 'none':
+                continue
+            height = fmt.get('height', 0) or 0
+            key = (height, fmt.get('fps', 0) or 0)
+            is_priority = fmt.get('format_id') == '137'
+            has_priority_any = has_priority_any or is_priority
+            if key > best_any_key:
+                best_any_key, best_any = key, fmt
+            if height <= max_height:
+                has_priority = has_priority or is_priority
+                if key > best_suitable_key:
+                    best_suitable_key, best_suitable = key, fmt
+
+        if best_any is None:
             logger.warning("No video-only formats found")
             return None
 
-        # Filter by max height
-        suitable_formats = [
-            f for f in video_formats
-            if (f.get('height') or 0) <= max_height
-        ]
-
-        if not suitable_formats:
+        if best_suitable is None:
             logger.warning(f"No formats found at or below {max_height}p")
-            suitable_formats = video_formats
-
-        # Try to find 1080p (format 137)
-        for fmt in suitable_formats:
-            if fmt.get('format_id') == '137':
-                logger.info("Selected priority video format: 137 (1080p)")
-                return '137'
-
-        # Fallback: select highest quality
-        suitable_formats.sort(
-            key=lambda f: (f.get('height', 0) or 0, f.get('fps', 0) or 0),
-            reverse=True
-        )
+            has_priority, best_format = has_priority_any, best_any
+        else:
+            best_format = best_suitable
+
+        # Prefer 1080p (format 137)
+        if has_priority:
+            logger.info("Selected priority video format: 137 (1080p)")
+            return '137'
 
-        best_format = suitable_formats[0]
         format_id = best_format.get('format_id')
         logger.info(
             f"Selected best video format: {format_id} "
@@ -639,7 +783,7 @@ class YouTubeHandler(PlatformHandler):
         self,
         temp_dir: str,
         content_type: ContentType,
-        progress_callback: Optional[Any] = None,
+        progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None,
         format_id: Optional[str] = None
     ) -> JSONDict:
         """
@@ -648,7 +792,7 @@ class YouTubeHandler(PlatformHandler):
         Args:
             temp_dir: Temporary directory for downloads
             content_type: Type of content (VIDEO or AUDIO)
-            progress_callback: Optional progress callback function
+            progress_hook: Optional non-blocking yt-dlp progress hook
             format_id: Optional specific format ID to download
 
         Returns:
@@ -672,6 +816,8 @@ class YouTubeHandler(PlatformHandler):
             'sleep_interval': download_config.sleep_interval,
             'max_sleep_interval': download_config.max_sleep_interval,
             'prefer_ffmpeg': download_config.prefer_ffmpeg,
+            # Initial read/write block size; yt-dlp starts at 1 KiB and grows slowly
+            'buffersize': download_config.buffer_size,
         }
 
         cookies_path = self._load_youtube_cookies()
@@ -679,17 +825,8 @@ class YouTubeHandler(PlatformHandler):
             base_opts['cookiefile'] = cookies_path
             logger.info(f"Using cookies file for download: {cookies_path}")
 
-        if progress_callback:
-            loop = asyncio.get_running_loop()
-
-            def sync_progress_hook(d: Dict[str, Any]) -> None:
-                try:
-                    future = asyncio.run_coroutine_threadsafe(progress_callback(d), loop)
-                    future.result(timeout=5)
-                except Exception as e:
-                    logger.debug(f"Progress callback error: {e}")
-
-            base_opts['progress_hooks'] = [sync_progress_hook]
+        if progress_hook:
+            base_opts['progress_hooks'] = [progress_hook]
 
         if content_type == ContentType.AUDIO:
             # Audio download options
@@ -741,22 +878,24 @@ class YouTubeHandler(PlatformHandler):
         content_type: ContentType
     ) -> Optional[Path]:
         """Find the downloaded file in the temporary directory"""
-        temp_path = Path(temp_dir)
+        # outtmpl writes straight into temp_dir, so a single flat scan suffices
+        ext_rank = _AUDIO_EXT_RANK if content_type == ContentType.AUDIO else _VIDEO_EXT_RANK
 
-        if content_type == ContentType.AUDIO:
-            # Look for audio files
-            for ext in ['.mp3', '.m4a', '.wav', '.ogg']:
-                files = list(temp_path.rglob(f'*{ext}'))
-                if files:
-                    return files[0]
-        else:
-            # Look for video files
-            for ext in ['.mp4', '.mkv', '.webm', '.avi']:
-                files = list(temp_path.rglob(f'*{ext}'))
-                if files:
-                    return files[0]
+        best_path = None
+        best_rank = len(ext_rank)
+        try:
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if '.' not in entry.name:
+                        continue
+                    rank = ext_rank.get(entry.name.rsplit('.', 1)[-1].lower())
+                    if rank is not None and rank < best_rank and entry.is_file():
+                        best_path, best_rank = entry.path, rank
+        except OSError as e:
+            logger.error(f"Failed to scan download directory {temp_dir}: {e}")
+            return None
 
-        return None
+        return Path(best_path) if best_path else None
 
     async def _download_subtitles(
         self,
@@ -5,25 +5,41 @@ Handles content downloading from various platforms through the platform manager.
 """
 
 import asyncio
+import functools
 from typing import Optional, Dict, Any, Callable
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from ..core.config import CONFIG
 from ..core.logger import get_logger
 from ..platforms.base import PlatformManager, ContentType, DownloadResult
+from ..utils.async_utils import SingleFlight
+from ..utils.common import generate_id
 
 logger = get_logger(__name__)
 
+# Distinct URL hosts remembered by the handler lookup cache
+HANDLER_CACHE_MAXSIZE = 128
+
 
 class DownloadService:
     """
     Download service that coordinates platform handlers and manages download operations
     """
 
-    def __init__(self):
+    def __init__(self, temp_root: Optional[str] = None):
+        """
+        Args:
+            temp_root: Optional parent directory for download temp dirs;
+                placing it on the storage filesystem lets files be moved
+                into storage instead of copied
+        """
+        self.temp_root = temp_root
         self.platform_manager = PlatformManager()
         self._setup_platforms()
         self._active_downloads: Dict[str, asyncio.Task] = {}
+        # Concurrent info lookups for the same URL share one extraction
+        self._inflight_info = SingleFlight()
 
     def _setup_platforms(self):
         """Register available platform handlers"""
@@ -31,16 +47,57 @@ class DownloadService:
         from ..platforms.twitter import TwitterHandler
 
         youtube_handler = YouTubeHandler()
+        youtube_handler.temp_root = self.temp_root
         self.platform_manager.register_handler(youtube_handler)
 
         twitter_handler = TwitterHandler()
         self.platform_manager.register_handler(twitter_handler)
 
+        # Handler matching only depends on the host; (re)build the lookup
+        # cache whenever the set of handlers changes
+        self._handler_for_host = functools.lru_cache(maxsize=HANDLER_CACHE_MAXSIZE)(
+            self._match_host
+        )
+
         logger.info(f"Registered platforms: {self.platform_manager.get_supported_platforms()}")
 
+    def _match_host(self, host: str):
+        """Run the full handler matching for a bare host URL"""
+        return self.platform_manager.get_handler(f"https://{host}/")
+
+    def get_handler(self, url: str):
+        """
+        Get the platform handler for a URL, cached per URL host
+
+        For http(s) URLs only the host decides the handler: a platform
+        domain that appears only in the path or query string (e.g.
+        https://example.com/?u=x.com/a) does not match, and host case is
+        ignored. Other input goes through the full PlatformManager matching.
+
+        Args:
+            url: Content URL
+
+        Returns:
+            PlatformHandler: Matching handler, or None
+        """
+        parts = urlsplit(url.strip()) if isinstance(url, str) else None
+        if not parts or parts.scheme not in ('http', 'https') or not parts.netloc:
+            return self.platform_manager.get_handler(url)
+        return self._handler_for_host(parts.netloc.lower())
+
+    @staticmethod
+    def make_download_id(url: str, content_type: str) -> str:
+        """
+        Build a download ID that is stable across processes
+
+        Unlike hash(), which is salted per interpreter, the same URL always
+        maps to the same ID, so IDs can be reused as dedup/cache keys.
+        """
+        return f"{generate_id(url)}_{content_type}"
+
     def can_handle_url(self, url: str) -> bool:
         """Check if any registered platform can handle the URL"""
-        return self.platform_manager.can_handle_url(url)
+        return self.get_handler(url) is not None
 
     def get_supported_platforms(self) -> list:
         """Get list of supported platforms"""
@@ -56,13 +113,15 @@ class DownloadService:
         Returns:
             dict: Content information or None if unavailable
         """
-        handler = self.platform_manager.get_handler(url)
+        handler = self.get_handler(url)
         if not handler:
             logger.warning(f"No handler found for URL: {url}")
             return None
 
         try:
-            content_info = await handler.get_content_info(url)
+            content_info = await self._inflight_info.do(
+                url, lambda: handler.get_content_info(url)
+            )
             if content_info:
                 result = {
                     "url": content_info.url,
@@ -109,12 +168,12 @@ class DownloadService:
             DownloadResult: Result of the download operation
         """
         if download_id is None:
-            download_id = f"{hash(url)}_{content_type}"
+            download_id = self.make_download_id(url, content_type)
 
         try:
             # Use the already-matched handler if provided
             if handler is None:
-                handler = self.platform_manager.get_handler(url)
+                handler = self.get_handler(url)
             if not handler:
                 return DownloadResult(
                     success=False,
@@ -185,7 +244,7 @@ class DownloadService:
         Returns:
             list: Available formats
         """
-        handler = self.platform_manager.get_handler(url)
+        handler = self.get_handler(url)
         if not handler:
             return []
 
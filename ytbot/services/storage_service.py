@@ -4,21 +4,36 @@ Storage service for YTBot
 Provides unified interface for local and cloud storage backends.
 """
 
+import logging
 import os
+import stat
 import shutil
 import asyncio
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Callable, Set, Coroutine, Mapping
 from datetime import datetime
 
 from ..core.config import CONFIG
 from ..core.enhanced_logger import get_logger, log_function_entry_exit
-from ..storage.local_storage import LocalStorageManager, get_local_storage_info
+from ..storage.local_storage import local_storage_manager, get_local_storage_info
 from ..storage.nextcloud_storage import NextcloudStorage
 from ..storage.cache_manager import get_cache_manager
+from ..utils.async_utils import SingleFlight
 
 logger = get_logger(__name__)
 
+# Seconds a Nextcloud connection check result is reused before probing again
+NEXTCLOUD_CHECK_TTL = 30
+
+# Seconds disk usage / cache statistics are reused by the status and health
+# reports, so frequent health checks do not rescan storage on every call
+STATUS_CACHE_TTL = 3
+
+# Upper bound in seconds for the background retry delay, which doubles after
+# every run that finds Nextcloud still unavailable
+RETRY_BACKOFF_MAX = 1800
+
 
 class StorageService:
     """
@@ -29,39 +44,160 @@ class StorageService:
     """
 
     def __init__(self):
-        self.local_storage = LocalStorageManager()
+        # Shared with get_local_storage_info() so both see one usage cache
+        self.local_storage = local_storage_manager
         self.nextcloud_storage = NextcloudStorage()
         self.cache_manager = get_cache_manager()
         self._nextcloud_available = None  # Will be determined on first use
+        self._nextcloud_checked_at = 0.0  # time.monotonic() of the last probe
+        # Normalized Nextcloud upload directory (always starts with '/')
+        upload_dir = CONFIG['nextcloud']['upload_dir']
+        self._remote_dir = upload_dir if upload_dir.startswith('/') else f'/{upload_dir}'
         self._retry_task: Optional[asyncio.Task] = None
+        # Concurrent async callers share one in-flight connection probe
+        self._probe_flight = SingleFlight()
+        # Every task started by the background retry machinery; stopped together
+        self._background_tasks: Set[asyncio.Task] = set()
         self._retry_interval = 300  # 5 minutes default retry interval
         self._is_retrying = False
+        # Set when a file is queued for retry, to wake an idle retry loop
+        self._retry_wake: Optional[asyncio.Event] = None
+        # key -> (time.monotonic() when computed, value), see _cached()
+        self._status_cache: Dict[str, Tuple[float, Any]] = {}
+
+    def _cached(self, key: str, compute: Callable[[], Any], ttl: float = STATUS_CACHE_TTL) -> Any:
+        """Return a value computed within the last ttl seconds, or compute it now"""
+        now = time.monotonic()
+        entry = self._status_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = compute()
+        self._status_cache[key] = (now, value)
+        return value
+
+    def _invalidate_status_cache(self) -> None:
+        """Drop cached usage/cache statistics after storage contents change"""
+        self._status_cache.clear()
+
+    def _build_remote_path(self, filename: str) -> str:
+        """Nextcloud path for a file or directory name in the upload directory"""
+        return f"{self._remote_dir}/{filename}"
 
     @property
     def nextcloud_available(self) -> bool:
-        """Check if Nextcloud is available"""
+        """
+        Check if Nextcloud is available
+
+        The connection is probed only on first use; after that the last
+        known result is returned without blocking. TTL re-probes happen in
+        ensure_nextcloud_available(), off the event loop.
+        """
         if self._nextcloud_available is None:
-            # Test Nextcloud connection on first use
-            self._nextcloud_available = self.nextcloud_storage.check_connection()
+            self._check_nextcloud_connection()
+        return self._nextcloud_available
+
+    async def ensure_nextcloud_available(self, recheck_unavailable: bool = False) -> bool:
+        """
+        Async counterpart of nextcloud_available
+
+        The probe, when one is due, runs in a worker thread and is shared by
+        all concurrent callers.
+
+        Args:
+            recheck_unavailable: Also re-probe an expired negative result
+                (used by the cache retry process)
+
+        Returns:
+            bool: Whether Nextcloud is available
+        """
+        available = self._nextcloud_available
+        if available is None or (
+            (available or recheck_unavailable) and self._nextcloud_check_expired()
+        ):
+            logger.debug("Checking Nextcloud connection...")
+            return await self._probe_flight.do(
+                "nextcloud", lambda: asyncio.to_thread(self._check_nextcloud_connection)
+            )
+        return available
+
+    def _nextcloud_check_expired(self) -> bool:
+        """Whether the last connection probe is older than NEXTCLOUD_CHECK_TTL"""
+        return time.monotonic() - self._nextcloud_checked_at >= NEXTCLOUD_CHECK_TTL
+
+    def _nextcloud_negative_fresh_for(self) -> float:
+        """Seconds until a cached 'unavailable' result may be re-probed (0 if none)"""
+        if self._nextcloud_available is not False:
+            return 0.0
+        return max(0.0, NEXTCLOUD_CHECK_TTL - (time.monotonic() - self._nextcloud_checked_at))
+
+    def _check_nextcloud_connection(self) -> bool:
+        """Probe the Nextcloud connection and remember the result"""
+        self._nextcloud_available = self.nextcloud_storage.check_connection()
+        self._nextcloud_checked_at = time.monotonic()
         return self._nextcloud_available
 
+    @property
+    def preferred_temp_dir(self) -> Optional[str]:
+        """
+        Directory for download temp files that can later be moved into
+        local storage without copying (None if local storage is disabled)
+        """
+        if not CONFIG['local_storage']['enabled']:
+            return None
+        return self.local_storage.get_temp_dir()
+
     def mark_nextcloud_unavailable(self):
         """Mark Nextcloud as unavailable (used when upload fails) with detailed logging"""
         logger.warning("⚠️  Nextcloud marked as unavailable, will use local storage")
         logger.info("🔄 Storage failover: Switching to local storage backend")
         self._nextcloud_available = False
+        self._nextcloud_checked_at = time.monotonic()
 
     def _cleanup_source(self, source_path: str):
         """Delete local source file or directory after successful Nextcloud upload"""
         try:
             if os.path.isdir(source_path):
                 shutil.rmtree(source_path)
-                logger.info(f"Deleted local source directory: {source_path}")
+                logger.info("Deleted local source directory: %s", source_path)
             elif os.path.isfile(source_path):
                 os.remove(source_path)
-                logger.info(f"Deleted local source file: {source_path}")
+                logger.info("Deleted local source file: %s", source_path)
+        except Exception as e:
+            logger.warning("Failed to delete local source %s: %s", source_path, e)
+
+    def _measure_source(self, source_path: str) -> Optional[Tuple[bool, int]]:
+        """
+        Stat a file or directory to be stored
+
+        Returns:
+            tuple: (is_directory, total size in bytes), or None if the path
+                does not exist
+        """
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        is_directory = stat.S_ISDIR(source_stat.st_mode)
+        if not is_directory:
+            logger.debug(
+                "File size: %d bytes (%.2f MB)",
+                source_stat.st_size, source_stat.st_size / 1024 / 1024
+            )
+            return False, source_stat.st_size
+
+        # Calculate total size of directory
+        total_size = 0
+        try:
+            for dirpath, _, filenames in os.walk(source_path):
+                for f in filenames:
+                    total_size += os.path.getsize(os.path.join(dirpath, f))
+            logger.debug("Dir size: %d bytes (%.2f MB)", total_size, total_size / 1024 / 1024)
         except Exception as e:
-            logger.warning(f"Failed to delete local source {source_path}: {e}")
+            logger.warning(f"⚠️  Could not get file size: {e}")
+            total_size = 0
+
+        return True, total_size
 
     def check_storage_quota(self, file_size_bytes: int) -> Dict[str, Any]:
         """
@@ -123,7 +259,8 @@ class StorageService:
         self,
         source_path: str,
         filename: str,
-        content_type: str = "media"
+        content_type: str = "media",
+        move: bool = False
     ) -> Dict[str, Any]:
         """
         Store a file or directory using the best available storage backend with detailed logging
@@ -132,13 +269,19 @@ class StorageService:
             source_path: Local file path or directory to store
             filename: Target filename
             content_type: Type of content (for organization)
+            move: Allow a single source file to be moved (not copied) into
+                local storage; use only for disposable temp files
 
         Returns:
             dict: Storage result with status and location info
         """
-        logger.info(f"📁 Storing file: {filename} (type: {content_type})")
-        logger.debug(f"Source path: {source_path}")
-        logger.debug(f"Nextcloud available: {self.nextcloud_available}")
+        logger.info("📁 Storing file: %s (type: %s)", filename, content_type)
+        logger.debug("Source path: %s", source_path)
+
+        # Everything below that touches the disk or network runs in worker
+        # threads so a large upload or copy does not stall the event loop
+        nextcloud_available = await self.ensure_nextcloud_available()
+        logger.debug("Nextcloud available: %s", nextcloud_available)
 
         result = {
             "success": False,
@@ -149,8 +292,10 @@ class StorageService:
             "cached": False
         }
 
-        # Validate source file exists
-        if not os.path.exists(source_path):
+        # Validate source file exists; one stat gives existence, type and size
+        source_size = await asyncio.to_thread(self._measure_source, source_path)
+
+        if source_size is None:
             error_msg = f"Source file does not exist: {source_path}"
             logger.error(f"❌ {error_msg}")
             result["error"] = error_msg
@@ -161,38 +306,14 @@ class StorageService:
             }
             return result
 
-        # Check if source is a directory
-        is_directory = os.path.isdir(source_path)
-
-        # Get file size for logging
-        try:
-            if is_directory:
-                # Calculate total size of directory
-                total_size = 0
-                for dirpath, _, filenames in os.walk(source_path):
-                    for f in filenames:
-                        file_path = os.path.join(dirpath, f)
-                        file_size = os.path.getsize(file_path)
-                        total_size += file_size
-                size_mb = total_size / 1024 / 1024
-                dbg_msg = f"Dir size: {total_size} bytes"
-                logger.debug(
-                    f"{dbg_msg} ({size_mb:.2f} MB)"
-                )
-            else:
-                file_size = os.path.getsize(source_path)
-                size_mb = file_size / 1024 / 1024
-                logger.debug(f"File size: {file_size} bytes ({size_mb:.2f} MB)")
-        except Exception as e:
-            logger.warning(f"⚠️  Could not get file size: {e}")
-            file_size = 0
+        is_directory, size_to_check = source_size
 
         # Check storage quota before attempting upload
         try:
-            # Use total_size for directories, file_size for single files
-            size_to_check = total_size if is_directory else file_size
             if size_to_check > 0:
-                quota_check = self.check_storage_quota(size_to_check)
+                quota_check = await asyncio.to_thread(
+                    self.check_storage_quota, size_to_check
+                )
 
                 if not quota_check["ok"]:
                     warning_msg = (
@@ -206,34 +327,31 @@ class StorageService:
         except Exception as e:
             logger.warning(f"⚠️  Could not perform storage quota check: {e}")
 
+        # Remote path is needed both for the upload and for the
+        # pre-computed retry path of a local fallback
+        remote_path = self._build_remote_path(filename)
+        delete_after_upload = CONFIG['local_storage']['delete_after_upload']
+
         # Try Nextcloud first if available
-        logger.info("🚀 Starting storage process...")
-        if self.nextcloud_available:
-            logger.info("☁️  Attempting Nextcloud storage...")
+        logger.debug("🚀 Starting storage process...")
+        if nextcloud_available:
+            logger.debug("☁️  Attempting Nextcloud storage...")
             try:
-                # Build remote path with content type organization
-                remote_dir = CONFIG['nextcloud']['upload_dir']
-                if not remote_dir.startswith('/'):
-                    remote_dir = f'/{remote_dir}'
-
                 # Store directly in upload_dir (no media type subdirectory)
                 if is_directory:
                     # Upload directory (for Twitter content with images/videos)
                     # filename is already the directory name (no extension)
-                    remote_path = f"{remote_dir}/{filename}"
-
-                    logger.debug(f"Remote path: {remote_path}")
+                    logger.debug("Remote path: %s", remote_path)
                     logger.debug("Uploading directory to Nextcloud...")
 
-                    nc_storage = self.nextcloud_storage
-                    upload_result = nc_storage.upload_directory(
+                    upload_result = await asyncio.to_thread(
+                        self.nextcloud_storage.upload_directory,
                         source_path, remote_path
                     )
 
                     if upload_result.get("success"):
                         file_url = upload_result.get("file_url")
-                        msg = "✅ Directory stored in Nextcloud"
-                        logger.info(f"{msg}: {file_url}")
+                        logger.info("✅ Directory stored in Nextcloud: %s", file_url)
                         result.update({
                             "success": True,
                             "storage_type": "nextcloud",
@@ -246,10 +364,8 @@ class StorageService:
                         })
 
                         # Delete local source after successful upload
-                        if CONFIG.get('local_storage', {}).get(
-                            'delete_after_upload', False
-                        ):
-                            self._cleanup_source(source_path)
+                        if delete_after_upload:
+                            await asyncio.to_thread(self._cleanup_source, source_path)
 
                         return result
                     else:
@@ -261,15 +377,15 @@ class StorageService:
                         self.mark_nextcloud_unavailable()
                 else:
                     # Upload single file
-                    remote_path = f"{remote_dir}/{filename}"
-
-                    logger.debug(f"Remote path: {remote_path}")
+                    logger.debug("Remote path: %s", remote_path)
                     logger.debug("Uploading file to Nextcloud...")
 
-                    file_url = self.nextcloud_storage.upload_file(source_path, remote_path)
+                    file_url = await asyncio.to_thread(
+                        self.nextcloud_storage.upload_file, source_path, remote_path
+                    )
 
                     if file_url:
-                        logger.info(f"✅ File stored in Nextcloud: {file_url}")
+                        logger.info("✅ File stored in Nextcloud: %s", file_url)
                         result.update({
                             "success": True,
                             "storage_type": "nextcloud",
@@ -278,10 +394,8 @@ class StorageService:
                         })
 
                         # Delete local source after successful upload
-                        if CONFIG.get('local_storage', {}).get(
-                            'delete_after_upload', False
-                        ):
-                            self._cleanup_source(source_path)
+                        if delete_after_upload:
+                            await asyncio.to_thread(self._cleanup_source, source_path)
 
                         return result
                     else:
@@ -294,17 +408,21 @@ class StorageService:
                 logger.exception("Nextcloud upload error details:")
                 self.mark_nextcloud_unavailable()
         else:
-            logger.info("☁️  Nextcloud not available, skipping to local storage")
+            logger.debug("☁️  Nextcloud not available, skipping to local storage")
 
         # Fallback to local storage
         if CONFIG['local_storage']['enabled']:
-            logger.info("💾 Attempting local storage...")
+            logger.debug("💾 Attempting local storage...")
             try:
                 logger.debug("Saving file locally...")
-                local_path = self.local_storage.save_file_locally(source_path, filename)
+                local_path = await self.local_storage.run_io(
+                    self.local_storage.save_file_locally,
+                    source_path, filename, move=move
+                )
 
                 if local_path:
-                    logger.info(f"✅ File stored locally: {local_path}")
+                    logger.info("✅ File stored locally: %s", local_path)
+                    self._invalidate_status_cache()
 
                     # For directory content, cache the parent directory
                     # so that retry can upload the entire directory
@@ -317,10 +435,6 @@ class StorageService:
                     }
 
                     # Pre-compute remote path for retry consistency
-                    remote_dir = CONFIG['nextcloud']['upload_dir']
-                    if not remote_dir.startswith('/'):
-                        remote_dir = f'/{remote_dir}'
-
                     if is_directory:
                         # local_path is the HTML file inside the tweet dir
                         # Cache the parent directory instead
@@ -329,20 +443,14 @@ class StorageService:
                         # Use directory name as filename for remote path
                         cache_filename = Path(cache_dir_path).name
                         cache_metadata["is_directory"] = True
-                        # Pre-compute remote path: /YTBot/dirname
-                        cache_metadata["remote_path"] = (
-                            f"{remote_dir}/{filename}"
-                        )
-                        logger.info(
-                            f"📁 Caching directory for retry: {cache_dir_path}"
-                        )
-                    else:
-                        cache_metadata["remote_path"] = (
-                            f"{remote_dir}/{filename}"
-                        )
+                        logger.debug("📁 Caching directory for retry: %s", cache_dir_path)
+
+                    # Pre-compute remote path: /YTBot/<filename or dirname>
+                    cache_metadata["remote_path"] = remote_path
 
                     # Add to cache queue for later retry
-                    cache_added = self.cache_manager.add_to_cache(
+                    cache_added = await asyncio.to_thread(
+                        self.cache_manager.add_to_cache,
                         file_path=cache_file_path,
                         filename=cache_filename,
                         content_type=content_type,
@@ -350,8 +458,10 @@ class StorageService:
                     )
 
                     if cache_added:
-                        logger.info("📋 File added to cache queue for later upload to Nextcloud")
+                        logger.debug("📋 File added to cache queue for later upload to Nextcloud")
                         result["cached"] = True
+                        if self._retry_wake is not None:
+                            self._retry_wake.set()
                     else:
                         logger.warning("⚠️  Failed to add file to cache queue")
 
@@ -386,22 +496,21 @@ class StorageService:
                 "available": self.nextcloud_available,
                 "url": CONFIG['nextcloud']['url'] if CONFIG['nextcloud']['url'] else None
             },
-            "local_storage": get_local_storage_info()
+            "local_storage": self._cached("local_storage_info", get_local_storage_info)
         }
 
         nc_available = 'Available' if info['nextcloud']['available'] else 'Unavailable'
-        logger.info(f"☁️  Nextcloud: {nc_available}")
+        logger.info("☁️  Nextcloud: %s", nc_available)
         if info['nextcloud']['url']:
-            logger.debug(f"Nextcloud URL: {info['nextcloud']['url']}")
+            logger.debug("Nextcloud URL: %s", info['nextcloud']['url'])
 
         local_info = info['local_storage']
         local_enabled = 'Enabled' if local_info.get('enabled', False) else 'Disabled'
-        logger.info(f"💾 Local Storage: {local_enabled}")
-        if local_info.get('enabled'):
-            logger.debug(f"Local path: {local_info.get('path', 'Unknown')}")
-            logger.debug(f"Usage: {local_info.get('usage_mb', 0):.1f} MB")
-            space = local_info.get('available_space_mb', 0)
-            logger.debug(f"Available space: {space:.1f} MB")
+        logger.info("💾 Local Storage: %s", local_enabled)
+        if local_info.get('enabled') and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Local path: %s", local_info.get('path', 'Unknown'))
+            logger.debug("Usage: %.1f MB", local_info.get('usage_mb', 0))
+            logger.debug("Available space: %.1f MB", local_info.get('available_space_mb', 0))
 
         return info
 
@@ -413,6 +522,7 @@ class StorageService:
         if CONFIG['local_storage']['enabled']:
             logger.debug("Local storage is enabled, proceeding with cleanup...")
             result = self.local_storage.cleanup_old_files()
+            self._invalidate_status_cache()
 
             if result.get('success', False):
                 logger.info(f"✅ Cleanup completed: {result.get('files_removed', 0)} files removed")
@@ -483,9 +593,8 @@ class StorageService:
             "errors": []
         }
 
-        # Check Nextcloud connection
-        logger.debug("Checking Nextcloud connection...")
-        if not self.nextcloud_storage.check_connection():
+        # Check Nextcloud connection, reusing a recent probe result
+        if not await self.ensure_nextcloud_available(recheck_unavailable=True):
             logger.warning("⚠️  Nextcloud still unavailable, skipping retry")
             result["success"] = False
             result["errors"].append("Nextcloud unavailable")
@@ -494,146 +603,174 @@ class StorageService:
         result["nextcloud_available"] = True
         logger.info("✅ Nextcloud connection restored")
 
-        # Mark Nextcloud as available again
-        self._nextcloud_available = True
+        total = len(self.cache_manager)
 
-        # Get cache queue
-        cache_queue = self.cache_manager.get_cache_queue()
-
-        if not cache_queue:
+        if not total:
             logger.info("📋 Cache queue is empty, nothing to retry")
             return result
 
-        logger.info(f"📋 Found {len(cache_queue)} files in cache queue")
+        logger.info("📋 Found %d files in cache queue", total)
 
-        # Process each cached file
-        for cache_entry in cache_queue:
-            file_path = cache_entry.get('file_path')
-            filename = cache_entry.get('filename')
-            content_type = cache_entry.get('content_type', 'media')
-            metadata = cache_entry.get('metadata', {})
-            is_directory = metadata.get('is_directory', False)
+        # Upload several cached files at once; per-file WebDAV round trips
+        # dominate when draining many small files. Entries are streamed to
+        # the upload workers through a bounded queue.
+        parallel_uploads = CONFIG['nextcloud']['parallel_uploads']
+        work_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * parallel_uploads)
 
-            result["files_processed"] += 1
+        # Settings shared by every entry are resolved once per retry run
+        delete_after_upload = CONFIG['local_storage']['delete_after_upload']
 
-            logger.info(
-                f"📤 Retrying file {result['files_processed']}/{len(cache_queue)}: "
-                f"{filename} ({'directory' if is_directory else 'file'})"
-            )
+        # Uploaded and vanished entries leave the queue in one write
+        finished_paths = []
+
+        def record(cache_entry: Mapping[str, Any], outcome: Dict[str, Any]) -> None:
+            result["files_processed"] += 1
+            if outcome.get("remove_from_cache"):
+                finished_paths.append(cache_entry.get('file_path'))
 
-            # Check if file/directory still exists
-            if not file_path or not os.path.exists(file_path):
-                logger.warning(f"⚠️  Cached path no longer exists: {file_path}")
-                # Remove from cache
-                self.cache_manager.remove_from_cache(file_path)
+            if outcome["uploaded"]:
+                result["files_uploaded"] += 1
+            else:
                 result["files_failed"] += 1
-                result["errors"].append(f"Path not found: {filename}")
-                continue
+                result["errors"].append(outcome["error"])
+
+        async def producer() -> None:
+            for index, cache_entry in enumerate(self.cache_manager.iter_cache(), 1):
+                await work_queue.put((index, cache_entry))
+            for _ in range(parallel_uploads):
+                await work_queue.put(None)
+
+        async def worker() -> None:
+            while True:
+                item = await work_queue.get()
+                if item is None:
+                    return
+
+                index, cache_entry = item
+                try:
+                    outcome = await self._retry_one(
+                        cache_entry, index, total, delete_after_upload
+                    )
+                except Exception as e:
+                    filename = cache_entry.get('filename')
+                    logger.error("❌ Error uploading cached file %s: %s", filename, e)
+                    outcome = {"uploaded": False, "error": f"{filename}: {str(e)}"}
+                record(cache_entry, outcome)
 
-            try:
-                # Use pre-computed remote path from cache metadata
-                # to ensure consistency with the original upload attempt
-                cached_remote_path = metadata.get('remote_path')
-                if cached_remote_path:
-                    remote_path = cached_remote_path
-                else:
-                    # Fallback: compute remote path (for legacy cache entries)
-                    remote_dir = CONFIG['nextcloud']['upload_dir']
-                    if not remote_dir.startswith('/'):
-                        remote_dir = f'/{remote_dir}'
-                    if is_directory:
-                        name, _ = os.path.splitext(filename)
-                        remote_path = f"{remote_dir}/{name}"
-                    else:
-                        remote_path = f"{remote_dir}/{filename}"
+        await asyncio.gather(producer(), *(worker() for _ in range(parallel_uploads)))
 
-                if is_directory:
-                    # Upload entire directory (including images/videos)
-                    logger.debug(f"Uploading directory to: {remote_path}")
+        # The queue database write stays off the event loop
+        await asyncio.to_thread(self.cache_manager.remove_many, finished_paths)
+        self._invalidate_status_cache()
 
-                    upload_result = self.nextcloud_storage.upload_directory(
-                        file_path, remote_path
-                    )
+        logger.info(
+            "✅ Cache retry completed: %d uploaded, %d failed out of %d processed",
+            result['files_uploaded'], result['files_failed'], result['files_processed']
+        )
 
-                    if upload_result.get("success"):
-                        file_url = upload_result.get("file_url")
-                        logger.info(
-                            f"✅ Successfully uploaded directory: {file_url}"
-                        )
+        return result
 
-                        # Remove from cache queue
-                        self.cache_manager.remove_from_cache(file_path)
-
-                        # Optionally delete local directory after upload
-                        if CONFIG.get('local_storage', {}).get(
-                            'delete_after_upload', False
-                        ):
-                            try:
-                                shutil.rmtree(file_path)
-                                logger.debug(
-                                    f"Deleted local cache directory: {file_path}"
-                                )
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to delete local cache dir: {e}"
-                                )
-
-                        result["files_uploaded"] += 1
-                    else:
-                        errors = upload_result.get('errors', [])
-                        logger.warning(
-                            f"⚠️  Directory upload failed for: {filename}, "
-                            f"errors: {errors}"
-                        )
-                        result["files_failed"] += 1
-                        result["errors"].append(
-                            f"Directory upload failed: {filename}"
-                        )
+    async def _retry_one(
+        self,
+        cache_entry: Mapping[str, Any],
+        index: int,
+        total: int,
+        delete_after_upload: bool
+    ) -> Dict[str, Any]:
+        """
+        Upload a single cached file or directory to Nextcloud
+
+        Args:
+            cache_entry: Cache queue entry
+            index: Position of the entry in the queue (for logging)
+            total: Number of entries in the queue (for logging)
+            delete_after_upload: Delete the local copy once uploaded
+
+        Returns:
+            dict: {"uploaded": bool, "error": Optional[str],
+                   "remove_from_cache": bool}; the caller removes finished
+                   entries from the cache queue in one batch
+        """
+        file_path = cache_entry.get('file_path')
+        filename = cache_entry.get('filename')
+        metadata = cache_entry.get('metadata', {})
+        is_directory = metadata.get('is_directory', False)
+
+        logger.debug(
+            "📤 Retrying file %d/%d: %s (%s)",
+            index, total, filename, 'directory' if is_directory else 'file'
+        )
+
+        # Check if file/directory still exists (off the event loop)
+        if not file_path or not await self.local_storage.run_io(os.path.exists, file_path):
+            logger.warning("⚠️  Cached path no longer exists: %s", file_path)
+            return {
+                "uploaded": False,
+                "error": f"Path not found: {filename}",
+                "remove_from_cache": True
+            }
+
+        try:
+            # Use pre-computed remote path from cache metadata
+            # to ensure consistency with the original upload attempt
+            cached_remote_path = metadata.get('remote_path')
+            if cached_remote_path:
+                remote_path = cached_remote_path
+            else:
+                # Fallback: compute remote path (for legacy cache entries)
+                if is_directory:
+                    name, _ = os.path.splitext(filename)
+                    remote_path = self._build_remote_path(name)
                 else:
-                    # Upload single file
-                    logger.debug(f"Uploading to: {remote_path}")
+                    remote_path = self._build_remote_path(filename)
 
-                    file_url = self.nextcloud_storage.upload_file(
-                        file_path, remote_path
+            if is_directory:
+                # Upload entire directory (including images/videos)
+                logger.debug("Uploading directory to: %s", remote_path)
+
+                upload_result = await asyncio.to_thread(
+                    self.nextcloud_storage.upload_directory, file_path, remote_path
+                )
+
+                if not upload_result.get("success"):
+                    errors = upload_result.get('errors', [])
+                    logger.warning(
+                        "⚠️  Directory upload failed for: %s, errors: %s", filename, errors
                     )
+                    return {"uploaded": False, "error": f"Directory upload failed: {filename}"}
 
-                    if file_url:
-                        logger.info(f"✅ Successfully uploaded: {file_url}")
-
-                        # Remove from cache queue
-                        self.cache_manager.remove_from_cache(file_path)
-
-                        # Optionally delete local file after upload
-                        if CONFIG.get('local_storage', {}).get(
-                            'delete_after_upload', False
-                        ):
-                            try:
-                                os.remove(file_path)
-                                logger.debug(
-                                    f"Deleted local cache file: {file_path}"
-                                )
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to delete local cache file: {e}"
-                                )
-
-                        result["files_uploaded"] += 1
-                    else:
-                        logger.warning(f"⚠️  Upload failed for: {filename}")
-                        result["files_failed"] += 1
-                        result["errors"].append(f"Upload failed: {filename}")
+                logger.debug(
+                    "✅ Successfully uploaded directory: %s", upload_result.get('file_url')
+                )
+            else:
+                # Upload single file
+                logger.debug("Uploading to: %s", remote_path)
 
-            except Exception as e:
-                logger.error(f"❌ Error uploading cached file {filename}: {e}")
-                result["files_failed"] += 1
-                result["errors"].append(f"{filename}: {str(e)}")
+                file_url = await asyncio.to_thread(
+                    self.nextcloud_storage.upload_file, file_path, remote_path
+                )
 
-        logger.info(
-            f"✅ Cache retry completed: {result['files_uploaded']} uploaded, "
-            f"{result['files_failed']} failed out of {result['files_processed']} processed"
-        )
+                if not file_url:
+                    logger.warning("⚠️  Upload failed for: %s", filename)
+                    return {"uploaded": False, "error": f"Upload failed: {filename}"}
 
-        return result
+                logger.debug("✅ Successfully uploaded: %s", file_url)
+
+            # Optionally delete local copy after upload
+            if delete_after_upload:
+                try:
+                    await self.local_storage.run_io(
+                        shutil.rmtree if is_directory else os.remove, file_path
+                    )
+                    logger.debug("Deleted local cache copy: %s", file_path)
+                except Exception as e:
+                    logger.warning("Failed to delete local cache copy: %s", e)
+
+            return {"uploaded": True, "error": None, "remove_from_cache": True}
+
+        except Exception as e:
+            logger.error("❌ Error uploading cached file %s: %s", filename, e)
+            return {"uploaded": False, "error": f"{filename}: {str(e)}"}
 
     @log_function_entry_exit(logger)
     def get_cache_status(self) -> Dict[str, Any]:
@@ -645,7 +782,7 @@ class StorageService:
         """
         logger.info("📊 Getting cache status...")
 
-        cache_stats = self.cache_manager.get_cache_stats()
+        cache_stats = self._cached("cache_stats", self.cache_manager.get_cache_stats)
 
         status = {
             "cache_enabled": True,
@@ -681,13 +818,36 @@ class StorageService:
 
         logger.info(f"🔄 Starting background retry task (interval: {interval_seconds}s)")
         self._retry_interval = interval_seconds
+        self._retry_wake = asyncio.Event()
         self._is_retrying = True
 
+        # Probe Nextcloud now so the first upload does not wait for it
+        if self._nextcloud_available is None:
+            self._spawn_background_task(self.ensure_nextcloud_available())
+
         # Create background task
-        self._retry_task = asyncio.create_task(self._background_retry_loop())
+        self._retry_task = self._spawn_background_task(self._background_retry_loop())
 
         logger.info("✅ Background retry task started")
 
+    def _spawn_background_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Start a task owned by the service; it is tracked until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+        return task
+
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        """Forget a finished task and report how it ended"""
+        self._background_tasks.discard(task)
+        if task is self._retry_task:
+            # Let start_background_retry_task run again if the loop died
+            self._is_retrying = False
+            self._retry_task = None
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            logger.error(f"❌ Background storage task failed: {error!r}", exc_info=error)
+
     @log_function_entry_exit(logger)
     async def stop_background_retry_task(self):
         """Stop background retry task"""
@@ -698,14 +858,13 @@ class StorageService:
         logger.info("🛑 Stopping background retry task...")
         self._is_retrying = False
 
-        # Cancel the task
-        if self._retry_task:
-            self._retry_task.cancel()
-            try:
-                await self._retry_task
-            except asyncio.CancelledError:
-                pass
-            self._retry_task = None
+        # Cancel the retry loop together with any pending probe and wait
+        # for all of them, so none outlives the service
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._retry_task = None
 
         logger.info("✅ Background retry task stopped")
 
@@ -713,35 +872,56 @@ class StorageService:
         """
         Background loop that periodically checks and retries cached files
 
+        While Nextcloud stays unavailable the delay between runs doubles up
+        to RETRY_BACKOFF_MAX. Otherwise the loop waits at most the base
+        interval and wakes early when store_file queues a new file. A run
+        never reuses a cached negative connection check, so only real probes
+        count towards the backoff.
+
         This is an internal method that runs as an asyncio task.
         """
         logger.info("🔄 Background retry loop started")
 
+        delay = self._retry_interval
+        backoff_max = max(RETRY_BACKOFF_MAX, self._retry_interval)
+
         while self._is_retrying:
             try:
-                # Wait for the specified interval
-                await asyncio.sleep(self._retry_interval)
+                await self._wait_for_retry(delay, wake_early=delay == self._retry_interval)
 
-                # Check if there are cached files
-                cache_stats = self.cache_manager.get_cache_stats()
+                # Check if there are cached files; only the count is needed,
+                # so skip get_cache_stats() and its per-file stat calls
+                pending = len(self.cache_manager)
+
+                if pending > 0:
+                    # A failure seen moments ago (usually the upload that
+                    # queued the file) is still cached; let it expire so this
+                    # run re-probes instead of counting it as another failure
+                    fresh_for = self._nextcloud_negative_fresh_for()
+                    if fresh_for > 0:
+                        await asyncio.sleep(fresh_for)
 
-                if cache_stats.get("total_items", 0) > 0:
                     logger.info(
-                        f"🔄 Auto-retry: Found {cache_stats['total_items']} cached files, "
+                        f"🔄 Auto-retry: Found {pending} cached files, "
                         "attempting upload..."
                     )
 
                     # Attempt to retry cached files
                     result = await self.retry_cached_files()
 
-                    if result.get("success"):
+                    if result.get("nextcloud_available"):
                         logger.info(
                             f"✅ Auto-retry successful: {result['files_uploaded']} files uploaded"
                         )
+                        delay = self._retry_interval
                     else:
-                        logger.debug("Auto-retry: Nextcloud still unavailable")
+                        delay = min(delay * 2, backoff_max)
+                        logger.debug(
+                            "Auto-retry: Nextcloud still unavailable, next attempt in %ds", delay
+                        )
                 else:
                     logger.debug("Auto-retry: No cached files to process")
+                    delay = self._retry_interval
 
             except asyncio.CancelledError:
                 logger.info("Background retry loop cancelled")
@@ -753,6 +933,26 @@ class StorageService:
 
         logger.info("🔄 Background retry loop ended")
 
+    async def _wait_for_retry(self, delay: float, wake_early: bool) -> None:
+        """
+        Sleep until the next retry run
+
+        Args:
+            delay: Seconds to wait
+            wake_early: Return as soon as a new file is queued for retry
+        """
+        if wake_early and self._retry_wake is not None:
+            try:
+                await asyncio.wait_for(self._retry_wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(delay)
+
+        # Files queued from here on wake the following wait
+        if self._retry_wake is not None:
+            self._retry_wake.clear()
+
     @log_function_entry_exit(logger)
     def get_storage_health(self) -> Dict[str, Any]:
         """
@@ -763,6 +963,12 @@ class StorageService:
         """
         logger.info("🏥 Checking storage health...")
 
+        local_enabled = CONFIG['local_storage']['enabled']
+        disk = (
+            self._cached("disk_summary", self.local_storage.get_disk_summary)
+            if local_enabled else {}
+        )
+
         health = {
             "timestamp": datetime.now().isoformat(),
             "nextcloud": {
@@ -770,15 +976,9 @@ class StorageService:
                 "connected": self.nextcloud_storage.is_connected()
             },
             "local_storage": {
-                "enabled": CONFIG['local_storage']['enabled'],
-                "available_space_mb": (
-                    self.local_storage.get_available_space_mb()
-                    if CONFIG['local_storage']['enabled'] else 0
-                ),
-                "usage_mb": (
-                    self.local_storage.get_storage_usage_mb()
-                    if CONFIG['local_storage']['enabled'] else 0
-                )
+                "enabled": local_enabled,
+                "available_space_mb": disk.get("available_mb", 0),
+                "usage_mb": disk.get("usage_mb", 0)
             },
             "cache": self.get_cache_status()
         }
@@ -5,10 +5,15 @@ Handles Telegram bot communication and message processing.
 """
 
 import asyncio
+import logging
 import threading
+import time
+from urllib.parse import urlsplit
 from typing import Optional, Dict, Any, Callable, List
 from telegram import Bot
-from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler
+from telegram.ext import (
+    AIORateLimiter, Application, CommandHandler, MessageHandler, CallbackQueryHandler
+)
 from telegram.error import Conflict
 
 from ..core.config import CONFIG
@@ -16,6 +21,12 @@ from ..core.enhanced_logger import get_logger, log_function_entry_exit
 
 logger = get_logger(__name__)
 
+# Seconds the bot identity from get_me() is reused by get_bot_info()
+BOT_INFO_TTL = 3600
+
+# Times a request rejected with RetryAfter (HTTP 429) is retried by the rate limiter
+RATE_LIMIT_MAX_RETRIES = 3
+
 
 class TelegramService:
     """Telegram bot service for handling bot communication with unified connection management."""
@@ -56,6 +67,12 @@ class TelegramService:
         self._shutdown_event = asyncio.Event()
         self._initialized = True
         self._external_polling = False  # 标记是否有外部管理polling
+        self._bot_info: Optional[Dict[str, Any]] = None  # cached get_me() result
+        self._bot_info_at = 0.0  # time.monotonic() when _bot_info was fetched
+        # Chat permissions are read once: there is no config reload path,
+        # so changing ADMIN_CHAT_ID requires a restart
+        self._allowed_ids = frozenset(str(x) for x in CONFIG['telegram']['allowed_chat_ids'])
+        self._admin_id = str(CONFIG['telegram'].get('admin_chat_id', '') or '')
 
     @classmethod
     async def get_instance(cls) -> 'TelegramService':
@@ -84,12 +101,13 @@ class TelegramService:
                 logger.info("🔗 Connecting to Telegram servers...")
                 logger.debug(f"Token length: {len(self.token)} characters")
 
-                self.application = Application.builder().token(self.token).build()
+                self.application = self._build_application()
                 self.bot = self.application.bot
 
                 # Test connection
                 logger.debug("Testing connection with get_me()...")
                 bot_info = await self.bot.get_me()
+                self._remember_bot_info(bot_info)
                 logger.info(f"✅ Connected to Telegram: @{bot_info.username}")
                 logger.info(f"🤖 Bot ID: {bot_info.id}")
                 logger.info(f"📛 Bot Name: {bot_info.first_name}")
@@ -108,6 +126,46 @@ class TelegramService:
                 self._connected = False
                 return False
 
+    def _build_application(self) -> Application:
+        """
+        Build the Application with an explicitly sized HTTP connection pool
+
+        Sends and edits for concurrent downloads share the pool; polling
+        (getUpdates) keeps its own small pool so it never competes with them.
+        With TELEGRAM_RATE_LIMIT, requests are queued under Telegram's flood
+        limits instead of failing with 429 errors.
+        """
+        telegram_config = CONFIG['telegram']
+        builder = (
+            Application.builder()
+            .token(self.token)
+            .connection_pool_size(telegram_config['pool_size'])
+            .pool_timeout(telegram_config['pool_timeout'])
+            .connect_timeout(telegram_config['connect_timeout'])
+            .read_timeout(telegram_config['read_timeout'])
+            .get_updates_connection_pool_size(telegram_config['get_updates_pool_size'])
+            .get_updates_pool_timeout(telegram_config['get_updates_pool_timeout'])
+            .get_updates_connect_timeout(telegram_config['get_updates_connect_timeout'])
+            .get_updates_read_timeout(telegram_config['get_updates_read_timeout'])
+            # Sequential by default; TELEGRAM_CONCURRENT_UPDATES > 1 handles
+            # updates in parallel so a long download does not hold up other
+            # chats, /cancel or button presses
+            .concurrent_updates(telegram_config['concurrent_updates'])
+        )
+
+        if telegram_config['rate_limit']:
+            try:
+                # Defaults match Telegram's limits: 30 requests/s overall,
+                # 20 requests/min per group chat
+                builder = builder.rate_limiter(
+                    AIORateLimiter(max_retries=RATE_LIMIT_MAX_RETRIES)
+                )
+            except RuntimeError as e:
+                # aiolimiter (the rate-limiter extra) is not installed
+                logger.warning(f"⚠️  Telegram rate limiting disabled: {e}")
+
+        return builder.build()
+
     @log_function_entry_exit(logger)
     async def disconnect(self):
         """Disconnect from Telegram servers with detailed logging."""
@@ -149,6 +207,7 @@ class TelegramService:
                 # Clear references
                 self.application = None
                 self.bot = None
+                self._bot_info = None
                 self._connected = False
                 self._external_polling = False
                 self._shutdown_event.set()
@@ -206,7 +265,7 @@ class TelegramService:
                                     if not self._polling_started:  # Double-check
                                         await self.application.initialize()
                                         await self.application.start()
-                                        await self.application.updater.start_polling()
+                                        await self._start_updater()
                                         self._polling_started = True
                                         logger.info("✅ Telegram polling started after reconnection")
                             except Conflict as ce:
@@ -309,6 +368,8 @@ class TelegramService:
         try:
             # Try to get bot info as a health check
             bot_info = await self.bot.get_me()
+            if bot_info is not None:
+                self._remember_bot_info(bot_info)
             return bot_info is not None
         except Conflict:
             logger.warning("Conflict error during health check - another instance running")
@@ -341,7 +402,6 @@ class TelegramService:
         """Check if polling was ever started (flag set), regardless of current state"""
         return self._polling_started
 
-    @log_function_entry_exit(logger)
     async def send_message(
         self,
         chat_id: int,
@@ -349,16 +409,17 @@ class TelegramService:
         **kwargs
     ) -> Optional[Dict[str, Any]]:
         """Send a message to a chat with detailed logging"""
-        logger.info(f"📤 Sending message to chat {chat_id}")
-        logger.debug(f"Message text: {text[:50]}..." if len(text) > 50 else f"Message text: {text}")
-        logger.debug(f"Additional kwargs: {list(kwargs.keys())}")
+        logger.info("📤 Sending message to chat %s", chat_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Message text: {text[:50]}..." if len(text) > 50 else f"Message text: {text}")
+            logger.debug(f"Additional kwargs: {list(kwargs.keys())}")
 
         if not self.connected:
             logger.error("❌ Not connected to Telegram")
             return None
 
         try:
-            logger.debug(f"Calling bot.send_message with chat_id={chat_id}")
+            logger.debug("Calling bot.send_message with chat_id=%s", chat_id)
             message = await self.bot.send_message(
                 chat_id=chat_id,
                 text=text,
@@ -366,8 +427,8 @@ class TelegramService:
             )
 
             if message:
-                logger.info(f"✅ Message sent successfully to chat {chat_id}")
-                logger.debug(f"Message ID: {message.message_id}")
+                logger.info("✅ Message sent successfully to chat %s", chat_id)
+                logger.debug("Message ID: %s", message.message_id)
                 return message.to_dict()
             else:
                 logger.warning(f"⚠️  No message returned for chat {chat_id}")
@@ -378,7 +439,6 @@ class TelegramService:
             logger.exception("Message sending error details:")
             return None
 
-    @log_function_entry_exit(logger)
     async def edit_message(
         self,
         chat_id: int,
@@ -387,15 +447,16 @@ class TelegramService:
         **kwargs
     ) -> Optional[Dict[str, Any]]:
         """Edit an existing message with detailed logging"""
-        logger.info(f"✏️  Editing message {message_id} in chat {chat_id}")
-        logger.debug(f"New text: {text[:50]}..." if len(text) > 50 else f"New text: {text}")
+        logger.info("✏️  Editing message %s in chat %s", message_id, chat_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"New text: {text[:50]}..." if len(text) > 50 else f"New text: {text}")
 
         if not self.connected:
             logger.error("❌ Not connected to Telegram")
             return None
 
         try:
-            logger.debug(f"Calling bot.edit_message_text with message_id={message_id}")
+            logger.debug("Calling bot.edit_message_text with message_id=%s", message_id)
             message = await self.bot.edit_message_text(
                 chat_id=chat_id,
                 message_id=message_id,
@@ -404,7 +465,7 @@ class TelegramService:
             )
 
             if message:
-                logger.info(f"✅ Message {message_id} edited successfully in chat {chat_id}")
+                logger.info("✅ Message %s edited successfully in chat %s", message_id, chat_id)
                 return message.to_dict()
             else:
                 logger.warning(f"⚠️  No message returned for edit operation in chat {chat_id}")
@@ -413,7 +474,7 @@ class TelegramService:
         except Exception as e:
             error_str = str(e)
             if "Message is not modified" in error_str:
-                logger.debug(f"Message {message_id} content unchanged, skipping")
+                logger.debug("Message %s content unchanged, skipping", message_id)
                 return {"message_id": message_id, "unchanged": True}
             logger.error(f"❌ Failed to edit message {message_id} in {chat_id}: {e}")
             logger.exception("Message editing error details:")
@@ -428,14 +489,18 @@ class TelegramService:
             logger.error("❌ Not connected to Telegram")
             return None
 
+        # Bot identity rarely changes; reuse the result fetched on connect
+        if self._bot_info is not None and time.monotonic() - self._bot_info_at < BOT_INFO_TTL:
+            return self._bot_info
+
         try:
             logger.debug("Calling bot.get_me()...")
             bot_info = await self.bot.get_me()
 
             if bot_info:
                 logger.info(f"✅ Bot info retrieved: @{bot_info.username}")
-                logger.debug(f"Bot details: ID={bot_info.id}, Name={bot_info.first_name}")
-                return bot_info.to_dict()
+                logger.debug("Bot details: ID=%s, Name=%s", bot_info.id, bot_info.first_name)
+                return self._remember_bot_info(bot_info)
             else:
                 logger.warning("⚠️  No bot info returned")
                 return None
@@ -445,6 +510,12 @@ class TelegramService:
             logger.exception("Bot info retrieval error details:")
             return None
 
+    def _remember_bot_info(self, bot_info) -> Dict[str, Any]:
+        """Cache a get_me() result for get_bot_info()"""
+        self._bot_info = bot_info.to_dict()
+        self._bot_info_at = time.monotonic()
+        return self._bot_info
+
     @log_function_entry_exit(logger)
     def add_command_handler(self, command: str, callback):
         """Add a command handler with detailed logging"""
@@ -546,7 +617,7 @@ class TelegramService:
                 logger.info("🚀 Starting Telegram polling...")
                 await self.application.initialize()
                 await self.application.start()
-                await self.application.updater.start_polling()
+                await self._start_updater()
                 self._polling_started = True
                 self._external_polling = True  # Mark that polling is managed externally
                 logger.info("✅ Telegram polling started successfully")
@@ -564,6 +635,32 @@ class TelegramService:
                 self._polling_started = False
                 raise
 
+    async def _start_updater(self):
+        """
+        Start receiving updates: by webhook when TELEGRAM_WEBHOOK_URL is set,
+        otherwise by long polling
+
+        The webhook server answers Telegram as soon as an update is queued;
+        handlers then run concurrently (see concurrent_updates).
+        """
+        telegram_config = CONFIG['telegram']
+        webhook_url = telegram_config['webhook_url']
+        if not webhook_url:
+            await self.application.updater.start_polling()
+            return
+
+        logger.info(
+            f"🌐 Receiving updates by webhook on "
+            f"{telegram_config['webhook_listen']}:{telegram_config['webhook_port']}"
+        )
+        await self.application.updater.start_webhook(
+            listen=telegram_config['webhook_listen'],
+            port=telegram_config['webhook_port'],
+            url_path=urlsplit(webhook_url).path.lstrip('/'),
+            webhook_url=webhook_url,
+            secret_token=telegram_config['webhook_secret'] or None,
+        )
+
     @log_function_entry_exit(logger)
     async def stop_polling(self):
         """Stop polling for updates with detailed logging"""
@@ -621,7 +718,7 @@ class TelegramService:
                 logger.info("🔄 Restarting Telegram polling...")
                 await self.application.initialize()
                 await self.application.start()
-                await self.application.updater.start_polling()
+                await self._start_updater()
                 self._polling_started = True
                 self._external_polling = True
                 logger.info("✅ Telegram polling restarted successfully")
@@ -637,27 +734,20 @@ class TelegramService:
                 self._polling_started = False
                 return False
 
-    @log_function_entry_exit(logger)
     def check_user_permission(self, chat_id: int) -> bool:
         """Check if user has permission to use the bot with detailed logging"""
-        logger.debug(f"🔍 Checking permission for chat ID: {chat_id}")
-
-        allowed_ids = CONFIG['telegram']['allowed_chat_ids']
-        admin_id = CONFIG['telegram'].get('admin_chat_id', '')
-
-        logger.debug(f"Allowed IDs: {allowed_ids}")
-        logger.debug(f"Admin ID: {admin_id}")
+        logger.debug("🔍 Checking permission for chat ID: %s", chat_id)
 
         # Check if chat_id is in allowed list or is admin
-        is_allowed = str(chat_id) in allowed_ids
-        is_admin = str(chat_id) == admin_id
-        has_permission = is_allowed or is_admin
+        sid = str(chat_id)
+        is_admin = bool(self._admin_id) and sid == self._admin_id
+        has_permission = is_admin or sid in self._allowed_ids
 
         if has_permission:
-            logger.info(f"✅ Permission granted for chat ID: {chat_id}")
+            logger.info("✅ Permission granted for chat ID: %s", chat_id)
             if is_admin:
-                logger.debug(f"Chat {chat_id} is admin")
+                logger.debug("Chat %s is admin", chat_id)
         else:
-            logger.warning(f"❌ Permission denied for chat ID: {chat_id}")
+            logger.warning("❌ Permission denied for chat ID: %s", chat_id)
 
         return has_permission
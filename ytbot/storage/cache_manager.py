@@ -7,33 +7,64 @@ Provides persistent queue for retry uploads.
 
 import json
 import os
+import shutil
+import sqlite3
+import stat
+import sys
 import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Mapping, Callable, Tuple, TypeVar
 
 from ..core.config import CONFIG
 from ..core.logger import get_logger
+from ..utils.async_utils import get_thread_pool
+from ..utils.common import format_timestamp
 
 logger = get_logger(__name__)
 
+T = TypeVar('T')
+
+# Queue size from which per-file existence checks and deletions are
+# spread over worker threads
+PARALLEL_IO_THRESHOLD = 64
+
 
 class CacheManager:
     """
     Thread-safe cache file manager with persistent queue
 
     Manages files that failed to upload to Nextcloud, storing metadata
-    in a JSON file for later retry processing.
+    in a SQLite database (WAL mode) for later retry processing. Each
+    mutation writes only the affected rows instead of rewriting the
+    whole queue; the in-memory list mirrors the table for fast reads.
     """
 
     MAX_CACHE_QUEUE_SIZE = 1000
 
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_queue (
+            file_path TEXT PRIMARY KEY,
+            filename TEXT NOT NULL,
+            content_type TEXT NOT NULL,
+            size INTEGER NOT NULL DEFAULT 0,
+            timestamp REAL NOT NULL,
+            metadata TEXT NOT NULL DEFAULT '{}'
+        );
+        CREATE INDEX IF NOT EXISTS idx_cache_queue_timestamp ON cache_queue (timestamp);
+    """
+
     def __init__(self, cache_dir: Optional[str] = None):
         """
         Initialize cache manager
 
         Args:
-            cache_dir: Directory for cache files and queue JSON.
+            cache_dir: Directory for cache files and the queue database.
                       Defaults to local storage path if not specified.
         """
         # Use local storage path as default cache directory
@@ -41,16 +72,29 @@ class CacheManager:
             cache_dir = CONFIG['local_storage']['path']
 
         self.cache_dir = Path(cache_dir)
-        self.queue_file = self.cache_dir / "cache_queue.json"
+        self.db_file = self.cache_dir / "cache_queue.db"
+        # Queue file written by earlier versions, imported once on startup
+        self.legacy_queue_file = self.cache_dir / "cache_queue.json"
 
-        # Thread lock for safe concurrent access
+        # Thread lock for safe concurrent access (also guards the connection)
         self._lock = threading.Lock()
 
         # Ensure cache directory exists
         self._ensure_cache_directory()
 
+        self._db = self._connect()
+
         # Load existing cache queue
-        self._cache_queue: List[Dict[str, Any]] = self._load_queue()
+        # file_path -> entry; insertion order is queue order. Entries are
+        # stamped when inserted and loaded ordered by timestamp, so this is
+        # also timestamp order (oldest first) and never needs re-sorting
+        # Entries (and their metadata) are read-only views, so readers get
+        # them without copying
+        self._cache_queue: Dict[str, Mapping[str, Any]] = self._load_queue()
+        # content_type -> file paths (dict used as an ordered set, in queue order)
+        self._by_type: Dict[str, Dict[str, None]] = defaultdict(dict)
+        for entry in self._cache_queue.values():
+            self._by_type[entry['content_type']][entry['file_path']] = None
 
         logger.info(f"CacheManager initialized with {len(self._cache_queue)} cached items")
 
@@ -63,54 +107,226 @@ class CacheManager:
             logger.error(f"Failed to create cache directory: {e}")
             raise
 
-    def _load_queue(self) -> List[Dict[str, Any]]:
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the queue database in WAL mode and create the schema
+
+        Returns:
+            sqlite3.Connection: Autocommit connection shared across threads
+        """
+        try:
+            db = sqlite3.connect(str(self.db_file), check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            # Commits append to the WAL without an fsync; the WAL is synced
+            # once per checkpoint, which groups many queue mutations into
+            # one flush. A power loss can drop only the latest commits and
+            # never corrupts the database.
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(self._SCHEMA)
+            return db
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open cache queue database: {e}")
+            raise
+
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements as one transaction"""
+        self._db.execute("BEGIN")
+        try:
+            yield self._db
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        else:
+            self._db.execute("COMMIT")
+
+    @staticmethod
+    def _measure(file_path: str, is_directory: bool = False) -> Optional[int]:
+        """
+        Size in bytes of a cached file or directory
+
+        Existence and size come from a single stat call.
+
+        Returns:
+            Size in bytes, 0 if unreadable, or None if the path does not exist
+        """
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            return 0
+        if is_directory and stat.S_ISDIR(st.st_mode):
+            try:
+                return sum(
+                    os.path.getsize(os.path.join(dp, fn))
+                    for dp, dn, fns in os.walk(file_path)
+                    for fn in fns
+                )
+            except OSError:
+                return 0
+        return st.st_size
+
+    def _forget(self, file_path: str) -> None:
+        """Drop a path from the in-memory queue and its content type index"""
+        entry = self._cache_queue.pop(file_path, None)
+        if entry is not None:
+            paths = self._by_type[entry['content_type']]
+            paths.pop(file_path, None)
+            if not paths:
+                del self._by_type[entry['content_type']]
+
+    @staticmethod
+    def _map_io(func: Callable[[Any], T], items: List[Any]) -> List[T]:
+        """
+        Apply a blocking file operation to each item, overlapping the calls
+        on the shared worker pool for large queues (slow or network-mounted
+        disks)
+        """
+        if len(items) < PARALLEL_IO_THRESHOLD:
+            return [func(item) for item in items]
+        return list(get_thread_pool().map(func, items))
+
+    @classmethod
+    def _check_exists(cls, paths: List[str]) -> List[bool]:
+        """os.path.exists for each path"""
+        return cls._map_io(os.path.exists, paths)
+
+    @staticmethod
+    def _delete_entry(entry: Mapping[str, Any]) -> Tuple[str, Optional[str]]:
         """
-        Load cache queue from JSON file
+        Delete a cached file or directory with one unlink/rmtree
 
         Returns:
-            List of cached file entries
+            ("deleted" | "not_found" | "error", error message or None)
         """
+        file_path = entry['file_path']
         try:
-            if self.queue_file.exists():
-                with open(self.queue_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    queue = data.get('cache_queue', [])
-                    logger.debug(f"Loaded {len(queue)} items from cache queue")
-                    return queue
+            if entry['metadata'].get('is_directory'):
+                shutil.rmtree(file_path)
             else:
-                logger.debug("No existing cache queue file found, starting fresh")
-                return []
+                os.remove(file_path)
+            return "deleted", None
+        except FileNotFoundError:
+            return "not_found", None
         except Exception as e:
-            logger.error(f"Failed to load cache queue: {e}")
-            return []
+            return "error", str(e)
 
-    def _save_queue(self) -> bool:
+    @staticmethod
+    def _make_entry(
+        file_path: str,
+        filename: str,
+        content_type: str,
+        size: int,
+        timestamp: float,
+        metadata: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """Build a read-only cache entry; metadata is copied and frozen too"""
+        return MappingProxyType({
+            "file_path": file_path,
+            "filename": filename,
+            "content_type": sys.intern(content_type),
+            "size": size,
+            "timestamp": timestamp,
+            "metadata": MappingProxyType(dict(metadata)),
+        })
+
+    @staticmethod
+    def to_dict(entry: Mapping[str, Any]) -> Dict[str, Any]:
         """
-        Save cache queue to JSON file (thread-safe)
+        Plain, modifiable copy of a cache entry (e.g. for json.dumps)
+
+        Args:
+            entry: Cache entry returned by this manager
 
         Returns:
-            bool: True if save successful, False otherwise
+            dict: Copy of the entry with a plain metadata dict
+        """
+        return {**entry, "metadata": dict(entry['metadata'])}
+
+    @staticmethod
+    def _row_params(entry: Mapping[str, Any]) -> tuple:
+        return (
+            entry['file_path'],
+            entry['filename'],
+            entry['content_type'],
+            entry['size'],
+            entry['timestamp'],
+            json.dumps(dict(entry['metadata']), ensure_ascii=False, separators=(',', ':')),
+        )
+
+    def _load_queue(self) -> Dict[str, Mapping[str, Any]]:
+        """
+        Load cache queue from the database, importing the legacy JSON queue
+        if the database is still empty
+
+        Returns:
+            Cached file entries keyed by file path, oldest first
         """
         try:
-            data = {
-                "cache_queue": self._cache_queue,
-                "last_updated": datetime.now().isoformat(),
-                "total_items": len(self._cache_queue)
+            self._import_legacy_queue()
+            rows = self._db.execute(
+                "SELECT file_path, filename, content_type, size, timestamp, metadata "
+                "FROM cache_queue ORDER BY timestamp, rowid"
+            ).fetchall()
+            # Content types come from a handful of values; interning keeps
+            # one string per type instead of one per loaded row
+            queue = {
+                file_path: self._make_entry(
+                    file_path, filename, content_type, size, timestamp, json.loads(metadata)
+                )
+                for file_path, filename, content_type, size, timestamp, metadata in rows
             }
+            logger.debug(f"Loaded {len(queue)} items from cache queue")
+            return queue
+        except Exception as e:
+            logger.error(f"Failed to load cache queue: {e}")
+            return {}
+
+    def _import_legacy_queue(self) -> None:
+        """Move entries from the old cache_queue.json into the database"""
+        if not self.legacy_queue_file.exists():
+            return
+        if self._db.execute("SELECT 1 FROM cache_queue LIMIT 1").fetchone():
+            return
+
+        with open(self.legacy_queue_file, 'r', encoding='utf-8') as f:
+            legacy = json.load(f).get('cache_queue', [])
+
+        # One stamp for entries without a usable one of their own
+        imported_at = time.time()
+        entries = []
+        for item in legacy:
+            if not item.get('file_path'):
+                continue
+            metadata = item.get('metadata') or {}
+            # The JSON queue stored ISO strings; the database stores epochs
+            try:
+                timestamp = datetime.fromisoformat(item['timestamp']).timestamp()
+            except (KeyError, TypeError, ValueError):
+                timestamp = imported_at
+            entries.append({
+                "file_path": item['file_path'],
+                "filename": item.get('filename', os.path.basename(item['file_path'])),
+                "content_type": item.get('content_type', 'unknown'),
+                "size": self._measure(item['file_path'], metadata.get('is_directory', False)) or 0,
+                "timestamp": timestamp,
+                "metadata": metadata,
+            })
+
+        with self._transaction() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO cache_queue VALUES (?, ?, ?, ?, ?, ?)",
+                [self._row_params(entry) for entry in entries]
+            )
 
-            # Write to temporary file first, then rename for atomicity
-            temp_file = self.queue_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            # Atomic rename
-            temp_file.rename(self.queue_file)
+        self.legacy_queue_file.rename(self.legacy_queue_file.with_suffix('.json.migrated'))
+        logger.info(f"Imported {len(entries)} items from legacy cache queue file")
 
-            logger.debug(f"Cache queue saved: {len(self._cache_queue)} items")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save cache queue: {e}")
-            return False
+    def close(self) -> None:
+        """Close the queue database"""
+        with self._lock:
+            self._db.close()
 
     def add_to_cache(
         self,
@@ -131,81 +347,104 @@ class CacheManager:
         Returns:
             bool: True if added successfully, False otherwise
         """
+        # Verify file exists and record its size outside the lock
+        metadata = metadata or {}
+        size = self._measure(file_path, metadata.get('is_directory', False))
+        if size is None:
+            logger.error(f"Cannot add to cache: file does not exist: {file_path}")
+            return False
+
         with self._lock:
             try:
-                # Verify file exists
-                if not os.path.exists(file_path):
-                    logger.error(f"Cannot add to cache: file does not exist: {file_path}")
-                    return False
-
                 # Create cache entry
-                entry = {
-                    "file_path": file_path,
-                    "filename": filename,
-                    "content_type": content_type,
-                    "timestamp": datetime.now().isoformat(),
-                    "metadata": metadata or {}
-                }
-
-                # Add to queue
-                self._cache_queue.append(entry)
-
-                # Enforce max queue size to prevent unbounded growth
-                if len(self._cache_queue) > self.MAX_CACHE_QUEUE_SIZE:
-                    removed = self._cache_queue[:len(self._cache_queue) - self.MAX_CACHE_QUEUE_SIZE]
-                    self._cache_queue = self._cache_queue[len(self._cache_queue) - self.MAX_CACHE_QUEUE_SIZE:]
+                entry = self._make_entry(
+                    file_path, filename, content_type, size, time.time(), metadata
+                )
+
+                # Enforce max queue size to prevent unbounded growth; a
+                # re-cached path replaces its previous entry
+                new_size = len(self._cache_queue) + (file_path not in self._cache_queue)
+                overflow = new_size - self.MAX_CACHE_QUEUE_SIZE
+                removed = []
+                if overflow > 0:
+                    removed = list(islice(
+                        (path for path in self._cache_queue if path != file_path), overflow
+                    ))
+
+                # Persist to disk
+                with self._transaction() as db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO cache_queue VALUES (?, ?, ?, ?, ?, ?)",
+                        self._row_params(entry)
+                    )
+                    if removed:
+                        db.executemany(
+                            "DELETE FROM cache_queue WHERE file_path = ?",
+                            [(path,) for path in removed]
+                        )
+
+                # Re-insert so a re-cached path moves to the end of the queue
+                self._forget(file_path)
+                self._cache_queue[file_path] = entry
+                self._by_type[entry['content_type']][file_path] = None
+                for path in removed:
+                    self._forget(path)
+                if removed:
                     logger.warning(
                         f"Cache queue exceeded {self.MAX_CACHE_QUEUE_SIZE}, "
                         f"removed {len(removed)} oldest entries"
                     )
-
-                # Persist to disk
-                if self._save_queue():
-                    logger.info(f"File added to cache: {filename} ({content_type})")
-                    logger.debug(f"Cache entry: {entry}")
-                    return True
-                else:
-                    # Remove from memory if save failed
-                    self._cache_queue.pop()
-                    return False
+                logger.info(f"File added to cache: {filename} ({content_type})")
+                logger.debug(
+                    f"Cache entry: {file_path} ({size} bytes, "
+                    f"cached {format_timestamp(entry['timestamp'])})"
+                )
+                return True
 
             except Exception as e:
                 logger.error(f"Failed to add file to cache: {e}")
                 return False
 
-    def get_cache_queue(self) -> List[Dict[str, Any]]:
+    def get_cache_queue(self) -> List[Mapping[str, Any]]:
         """
-        Get all cached file entries (copy of queue)
+        Get all cached file entries (read-only entries; copy with
+        to_dict() to modify or serialize)
 
         Returns:
             List of cache entries sorted by timestamp (oldest first)
         """
         with self._lock:
-            # Return a copy sorted by timestamp
-            return sorted(
-                self._cache_queue.copy(),
-                key=lambda x: x.get('timestamp', '')
-            )
+            return list(self._cache_queue.values())
+
+    def iter_cache(self) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterate cached file entries, oldest first
+
+        The order is fixed when iteration starts; the lock is not held while
+        the caller consumes entries, so the queue may change meanwhile.
+
+        Yields:
+            Cache entries sorted by timestamp (oldest first)
+        """
+        with self._lock:
+            order = list(self._cache_queue.values())
+        yield from order
+
+    def __len__(self) -> int:
+        # A single dict operation; no lock needed
+        return len(self._cache_queue)
 
-    def get_next_cache_item(self) -> Optional[Dict[str, Any]]:
+    def get_next_cache_item(self) -> Optional[Mapping[str, Any]]:
         """
         Get the next cache item to process (oldest first)
 
         Returns:
-            Cache entry dict or None if queue is empty
+            Read-only cache entry or None if queue is empty
         """
         with self._lock:
-            if not self._cache_queue:
-                return None
-
-            # Sort by timestamp and return oldest
-            sorted_queue = sorted(
-                self._cache_queue,
-                key=lambda x: x.get('timestamp', '')
-            )
-            return sorted_queue[0].copy() if sorted_queue else None
+            return next(iter(self._cache_queue.values()), None)
 
-    def get_cache_item_by_path(self, file_path: str) -> Optional[Dict[str, Any]]:
+    def get_cache_item_by_path(self, file_path: str) -> Optional[Mapping[str, Any]]:
         """
         Get a specific cache item by file path
 
@@ -213,13 +452,11 @@ class CacheManager:
             file_path: File path to search for
 
         Returns:
-            Cache entry dict or None if not found
+            Read-only cache entry or None if not found
         """
-        with self._lock:
-            for entry in self._cache_queue:
-                if entry.get('file_path') == file_path:
-                    return entry.copy()
-            return None
+        # A single dict lookup needs no lock: entries are read-only and
+        # writers replace them, so the entry read here stays consistent
+        return self._cache_queue.get(file_path)
 
     def remove_from_cache(self, file_path: str) -> bool:
         """
@@ -233,21 +470,12 @@ class CacheManager:
         """
         with self._lock:
             try:
-                # Find and remove the entry
-                original_length = len(self._cache_queue)
-                self._cache_queue = [
-                    entry for entry in self._cache_queue
-                    if entry.get('file_path') != file_path
-                ]
-
-                if len(self._cache_queue) < original_length:
+                if file_path in self._cache_queue:
                     # Persist changes
-                    if self._save_queue():
-                        logger.info(f"File removed from cache: {file_path}")
-                        return True
-                    else:
-                        logger.error(f"Failed to persist cache after removal: {file_path}")
-                        return False
+                    self._db.execute("DELETE FROM cache_queue WHERE file_path = ?", (file_path,))
+                    self._forget(file_path)
+                    logger.info(f"File removed from cache: {file_path}")
+                    return True
                 else:
                     logger.warning(f"File not found in cache: {file_path}")
                     return False
@@ -256,6 +484,41 @@ class CacheManager:
                 logger.error(f"Failed to remove file from cache: {e}")
                 return False
 
+    def remove_many(self, file_paths: Iterable[str]) -> int:
+        """
+        Remove several files from the cache queue in a single transaction
+
+        Args:
+            file_paths: File paths to remove
+
+        Returns:
+            int: Number of entries removed
+        """
+        paths = set(file_paths)
+        if not paths:
+            return 0
+
+        with self._lock:
+            try:
+                present = [path for path in paths if path in self._cache_queue]
+
+                removed_count = len(present)
+                if removed_count > 0:
+                    with self._transaction() as db:
+                        db.executemany(
+                            "DELETE FROM cache_queue WHERE file_path = ?",
+                            [(path,) for path in present]
+                        )
+                    for path in present:
+                        self._forget(path)
+                    logger.info(f"Removed {removed_count} files from cache")
+
+                return removed_count
+
+            except Exception as e:
+                logger.error(f"Failed to remove files from cache: {e}")
+                return 0
+
     def delete_cached_file(self, file_path: str) -> bool:
         """
         Delete a cached file from disk and remove from queue
@@ -269,25 +532,15 @@ class CacheManager:
         with self._lock:
             try:
                 # Remove from queue first
-                removed = False
-                original_length = len(self._cache_queue)
-                self._cache_queue = [
-                    entry for entry in self._cache_queue
-                    if entry.get('file_path') != file_path
-                ]
-
-                if len(self._cache_queue) < original_length:
-                    removed = True
+                if file_path in self._cache_queue:
+                    self._db.execute("DELETE FROM cache_queue WHERE file_path = ?", (file_path,))
+                    self._forget(file_path)
 
                 # Delete file from disk
                 if os.path.exists(file_path):
                     os.remove(file_path)
                     logger.info(f"Cache file deleted from disk: {file_path}")
 
-                # Persist queue changes
-                if removed:
-                    self._save_queue()
-
                 return True
 
             except Exception as e:
@@ -309,28 +562,30 @@ class CacheManager:
                 "space_freed_bytes": 0
             }
 
-            for entry in self._cache_queue:
-                file_path = entry.get('file_path')
-                if not file_path:
-                    continue
-
-                try:
-                    if os.path.exists(file_path):
-                        file_size = os.path.getsize(file_path)
-                        os.remove(file_path)
-                        stats["files_deleted"] += 1
-                        stats["space_freed_bytes"] += file_size
-                        logger.debug(f"Deleted cached file: {file_path}")
-                    else:
-                        stats["files_not_found"] += 1
-                        logger.debug(f"Cache file not found: {file_path}")
-                except Exception as e:
-                    stats["errors"].append(f"{file_path}: {str(e)}")
-                    logger.error(f"Failed to delete cache file {file_path}: {e}")
+            # Sizes were recorded when cached, so each file costs one unlink
+            entries = list(self._cache_queue.values())
+            outcomes = self._map_io(self._delete_entry, entries)
+
+            for entry, (outcome, error) in zip(entries, outcomes):
+                file_path = entry['file_path']
+                if outcome == "deleted":
+                    stats["files_deleted"] += 1
+                    stats["space_freed_bytes"] += entry.get('size', 0)
+                    logger.debug(f"Deleted cached file: {file_path}")
+                elif outcome == "not_found":
+                    stats["files_not_found"] += 1
+                    logger.debug(f"Cache file not found: {file_path}")
+                else:
+                    stats["errors"].append(f"{file_path}: {error}")
+                    logger.error(f"Failed to delete cache file {file_path}: {error}")
 
             # Clear queue
-            self._cache_queue = []
-            self._save_queue()
+            try:
+                self._db.execute("DELETE FROM cache_queue")
+            except sqlite3.Error as e:
+                logger.error(f"Failed to clear cache queue database: {e}")
+            self._cache_queue.clear()
+            self._by_type.clear()
 
             logger.info(
                 f"Cache cleared: {stats['files_deleted']} files deleted, "
@@ -348,50 +603,36 @@ class CacheManager:
             dict: Cache statistics
         """
         with self._lock:
-            total_size = 0
-            files_exist = 0
-            files_missing = 0
-            content_types = {}
-
-            for entry in self._cache_queue:
-                file_path = entry.get('file_path')
-                content_type = entry.get('content_type', 'unknown')
-                metadata = entry.get('metadata', {})
-                is_directory = metadata.get('is_directory', False)
-
-                # Count content types
-                content_types[content_type] = content_types.get(
-                    content_type, 0
-                ) + 1
-
-                # Check file existence and size
-                if file_path and os.path.exists(file_path):
-                    files_exist += 1
-                    try:
-                        if is_directory and os.path.isdir(file_path):
-                            # Calculate total directory size
-                            for dp, dn, fns in os.walk(file_path):
-                                for fn in fns:
-                                    fp = os.path.join(dp, fn)
-                                    total_size += os.path.getsize(fp)
-                        else:
-                            total_size += os.path.getsize(file_path)
-                    except Exception:
-                        pass
-                else:
-                    files_missing += 1
-
-            return {
-                "total_items": len(self._cache_queue),
-                "files_exist": files_exist,
-                "files_missing": files_missing,
-                "total_size_bytes": total_size,
-                "total_size_mb": total_size / (1024 * 1024),
-                "content_types": content_types,
-                "cache_dir": str(self.cache_dir),
-                "queue_file": str(self.queue_file)
+            entries = list(self._cache_queue.values())
+            content_types = {
+                content_type: len(paths) for content_type, paths in self._by_type.items()
             }
 
+        # Check file existence outside the lock; the size was recorded when cached
+        exists = self._check_exists([entry['file_path'] for entry in entries])
+
+        total_size = 0
+        files_exist = 0
+        files_missing = 0
+
+        for entry, present in zip(entries, exists):
+            if present:
+                files_exist += 1
+                total_size += entry.get('size', 0)
+            else:
+                files_missing += 1
+
+        return {
+            "total_items": len(entries),
+            "files_exist": files_exist,
+            "files_missing": files_missing,
+            "total_size_bytes": total_size,
+            "total_size_mb": total_size / (1024 * 1024),
+            "content_types": content_types,
+            "cache_dir": str(self.cache_dir),
+            "queue_file": str(self.db_file)
+        }
+
     def cleanup_missing_files(self) -> int:
         """
         Remove entries for files that no longer exist on disk
@@ -400,22 +641,36 @@ class CacheManager:
             int: Number of entries removed
         """
         with self._lock:
-            original_length = len(self._cache_queue)
+            entries = list(self._cache_queue.values())
+
+        exists = self._check_exists([entry['file_path'] for entry in entries])
 
-            self._cache_queue = [
-                entry for entry in self._cache_queue
-                if entry.get('file_path') and os.path.exists(entry['file_path'])
+        with self._lock:
+            # Skip paths re-cached while the checks ran
+            missing = [
+                entry['file_path'] for entry, present in zip(entries, exists)
+                if not present and self._cache_queue.get(entry['file_path']) is entry
             ]
 
-            removed_count = original_length - len(self._cache_queue)
+            removed_count = len(missing)
 
             if removed_count > 0:
-                self._save_queue()
+                try:
+                    with self._transaction() as db:
+                        db.executemany(
+                            "DELETE FROM cache_queue WHERE file_path = ?",
+                            [(path,) for path in missing]
+                        )
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to remove missing file entries from cache: {e}")
+                    return 0
+                for path in missing:
+                    self._forget(path)
                 logger.info(f"Cleaned up {removed_count} missing file entries from cache")
 
             return removed_count
 
-    def get_oldest_items(self, count: int = 10) -> List[Dict[str, Any]]:
+    def get_oldest_items(self, count: int = 10) -> List[Mapping[str, Any]]:
         """
         Get the oldest N items in the cache queue
 
@@ -426,13 +681,9 @@ class CacheManager:
             List of oldest cache entries
         """
         with self._lock:
-            sorted_queue = sorted(
-                self._cache_queue.copy(),
-                key=lambda x: x.get('timestamp', '')
-            )
-            return sorted_queue[:count]
+            return list(islice(self._cache_queue.values(), max(count, 0)))
 
-    def get_items_by_content_type(self, content_type: str) -> List[Dict[str, Any]]:
+    def get_items_by_content_type(self, content_type: str) -> List[Mapping[str, Any]]:
         """
         Get all cache items of a specific content type
 
@@ -443,16 +694,20 @@ class CacheManager:
             List of matching cache entries
         """
         with self._lock:
-            return [
-                entry.copy() for entry in self._cache_queue
-                if entry.get('content_type') == content_type
-            ]
+            return [self._cache_queue[path] for path in self._by_type.get(content_type, ())]
 
 
-# Global instance
-cache_manager = CacheManager()
+# Global instance, created on first use so importing the package does not
+# open (and create) the queue database
+_cache_manager: Optional[CacheManager] = None
+_cache_manager_lock = threading.Lock()
 
 
 def get_cache_manager() -> CacheManager:
-    """Get the global cache manager instance"""
-    return cache_manager
+    """Get or create the global cache manager instance"""
+    global _cache_manager
+    if _cache_manager is None:
+        with _cache_manager_lock:
+            if _cache_manager is None:
+                _cache_manager = CacheManager()
+    return _cache_manager
@@ -4,18 +4,99 @@ Local storage backend for YTBot
 Provides local file storage with automatic cleanup and space management.
 """
 
+import errno
 import os
 import shutil
+import stat
 import asyncio
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable, TypeVar
 
 from ..core.config import CONFIG
 from ..core.enhanced_logger import get_logger
+from ..utils.async_utils import get_thread_pool
 
 logger = get_logger(__name__)
 
+T = TypeVar('T')
+
+# Staging area for in-progress downloads, kept inside the storage path so that
+# finished files can be renamed into place instead of copied
+TEMP_DIR_NAME = ".incoming"
+
+# CacheManager keeps its queue database (with -wal/-shm files) in the storage
+# root; expiry cleanup must never delete it
+CACHE_QUEUE_PREFIX = "cache_queue."
+
+# Seconds a measured storage usage is reused before the tree is walked again;
+# saves and deletions made through this manager adjust it in between
+USAGE_CACHE_TTL = 300
+
+# copy_file_range errors meaning "not supported for these files", on which
+# _copy_file falls back to shutil (sendfile-based on Linux)
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+
+def _copy_file(source: Path, target: Path, size: Optional[int] = None) -> None:
+    """
+    Copy a file with its metadata, letting the kernel move the data
+
+    os.copy_file_range copies without passing data through user space and
+    lets filesystems that support it (btrfs, XFS, NFS, ...) share extents
+    or copy server-side instead of rewriting the bytes. Pass size when the
+    caller has already stat'ed the source.
+    """
+    if hasattr(os, 'copy_file_range'):
+        copied = 0
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                remaining = size if size is not None else os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if sent == 0:
+                        if not copied:
+                            # Like shutil: a call that copies nothing means
+                            # unsupported here; fall back below
+                            raise OSError(errno.EOPNOTSUPP, "copy_file_range copied nothing")
+                        # Source ended early: never report a truncated copy
+                        raise OSError(
+                            errno.EIO,
+                            f"copy_file_range stopped with {remaining} bytes left",
+                            str(source)
+                        )
+                    copied += sent
+                    remaining -= sent
+            shutil.copystat(source, target)
+            return
+        except OSError as e:
+            if copied or e.errno not in _COPY_RANGE_UNSUPPORTED:
+                raise
+
+    shutil.copy2(source, target)
+
+
+def _list_files(directory: Path) -> List[Path]:
+    """Regular files directly inside directory (scandir: no stat per entry)"""
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_file()]
+
+
+def _copy_files(pairs: List[Tuple[Path, Path]]) -> None:
+    """
+    Copy a batch of (source, target) files
+
+    Copies overlap on the shared worker pool, so a tweet's media costs about
+    one copy latency instead of one per file. Raises the first copy error.
+    """
+    if len(pairs) < 2:
+        for source, target in pairs:
+            _copy_file(source, target)
+        return
+    list(get_thread_pool().map(lambda pair: _copy_file(*pair), pairs))
+
 
 class LocalStorageManager:
     """Local storage manager with space management and automatic cleanup"""
@@ -25,11 +106,31 @@ class LocalStorageManager:
         self.max_size_mb = CONFIG['local_storage']['max_size_mb']
         self.cleanup_after_days = CONFIG['local_storage']['cleanup_after_days']
         self.enabled = CONFIG['local_storage']['enabled']
+        self.io_concurrency = CONFIG['local_storage']['io_concurrency']
+        self._io_slots: Optional[asyncio.Semaphore] = None  # created on first run_io()
+
+        # Storage usage from the last tree walk, kept current by our own
+        # saves/deletes; _usage_at is None until the first walk
+        self._usage_bytes = 0
+        self._usage_at: Optional[float] = None
+        self._usage_lock = threading.Lock()
 
         # Ensure storage directory exists
         if self.enabled:
             self._ensure_storage_directory()
 
+    async def run_io(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking storage operation in a worker thread
+
+        At most io_concurrency operations run at once, so a burst of saves
+        and cleanups queues up instead of all hitting the disk together.
+        """
+        if self._io_slots is None:
+            self._io_slots = asyncio.Semaphore(self.io_concurrency)
+        async with self._io_slots:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
     def _ensure_storage_directory(self):
         """Ensure storage directory exists"""
         try:
@@ -39,55 +140,118 @@ class LocalStorageManager:
             logger.error(f"Failed to create local storage directory: {e}")
             self.enabled = False
 
+    def get_temp_dir(self) -> Optional[str]:
+        """
+        Get a staging directory on the same filesystem as local storage
+
+        Returns:
+            str: Directory path, or None if local storage is unavailable
+        """
+        if not self.enabled:
+            return None
+
+        temp_dir = self.storage_path / TEMP_DIR_NAME
+        try:
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            return str(temp_dir)
+        except Exception as e:
+            logger.warning(f"Failed to create local staging directory: {e}")
+            return None
+
     def get_available_space_mb(self) -> float:
         """Get available disk space in MB"""
         try:
-            stat = shutil.disk_usage(self.storage_path)
-            return stat.free / (1024 * 1024)
+            usage = shutil.disk_usage(self.storage_path)
+            return usage.free / (1024 * 1024)
         except Exception as e:
             logger.error(f"Failed to get disk space: {e}")
             return 0.0
 
+    def list_stored_files(self) -> List[Tuple[str, os.stat_result]]:
+        """
+        List stored files (staging directory excluded) in one scandir pass
+
+        Returns:
+            list: [(file_path, stat_result), ...]
+        """
+        files, _ = self._scan_tree(
+            self.storage_path, skip_dir=self.storage_path / TEMP_DIR_NAME
+        )
+        return files
+
     def get_storage_usage_mb(self) -> float:
-        """Get current storage usage in MB"""
+        """Get current storage usage in MB (walks the tree at most every USAGE_CACHE_TTL)"""
         try:
-            total_size = 0
-            for file_path in self.storage_path.rglob('*'):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-            return total_size / (1024 * 1024)
+            with self._usage_lock:
+                if self._usage_at is None or time.monotonic() - self._usage_at > USAGE_CACHE_TTL:
+                    files = self.list_stored_files()
+                    self._usage_bytes = sum(file_stat.st_size for _, file_stat in files)
+                    self._usage_at = time.monotonic()
+                return self._usage_bytes / (1024 * 1024)
         except Exception as e:
             logger.error(f"Failed to calculate storage usage: {e}")
             return 0.0
 
+    def _adjust_usage(self, delta_bytes: int) -> None:
+        """Account for bytes added to or removed from storage since the last walk"""
+        with self._usage_lock:
+            if self._usage_at is not None:
+                self._usage_bytes = max(0, self._usage_bytes + delta_bytes)
+
+    def get_disk_summary(self) -> Dict[str, Any]:
+        """
+        Get free space and storage usage in one pass
+
+        Returns:
+            dict: {"path", "available_mb", "usage_mb"}
+        """
+        return {
+            "path": str(self.storage_path),
+            "available_mb": self.get_available_space_mb(),
+            "usage_mb": self.get_storage_usage_mb(),
+        }
+
     def can_store_file(self, file_size_mb: float) -> bool:
         """Check if there's enough space to store a file"""
         if not self.enabled:
             return False
 
-        available_space = self.get_available_space_mb()
-        current_usage = self.get_storage_usage_mb()
-
-        # Check capacity limits and available space
-        if (current_usage + file_size_mb) > self.max_size_mb:
-            logger.warning(f"Storage capacity exceeded: {current_usage:.1f}MB used + "
-                          f"{file_size_mb:.1f}MB needed > {self.max_size_mb}MB limit")
+        try:
+            disk = shutil.disk_usage(self.storage_path)
+        except Exception as e:
+            logger.error(f"Failed to get disk space: {e}")
             return False
+        available_space = disk.free / (1024 * 1024)
 
         if file_size_mb > available_space:
             logger.warning(f"Insufficient disk space: {available_space:.1f}MB available, "
                           f"{file_size_mb:.1f}MB needed")
             return False
 
+        # Stored files cannot take up more than the disk's used space, so
+        # when that already fits under the limit the tree walk is not needed
+        disk_used_mb = (disk.total - disk.free) / (1024 * 1024)
+        if disk_used_mb + file_size_mb <= self.max_size_mb:
+            return True
+
+        # Check capacity limits
+        current_usage = self.get_storage_usage_mb()
+        if (current_usage + file_size_mb) > self.max_size_mb:
+            logger.warning(f"Storage capacity exceeded: {current_usage:.1f}MB used + "
+                          f"{file_size_mb:.1f}MB needed > {self.max_size_mb}MB limit")
+            return False
+
         return True
 
-    def save_file_locally(self, source_path: str, filename: str) -> Optional[str]:
+    def save_file_locally(self, source_path: str, filename: str, move: bool = False) -> Optional[str]:
         """
         Save a file or directory to local storage
 
         Args:
             source_path: Source file or directory path
             filename: Target filename
+            move: Move a single source file instead of copying it
+                (a rename when it is on the same filesystem)
 
         Returns:
             str: Local file path if successful, None otherwise
@@ -98,20 +262,25 @@ class LocalStorageManager:
 
         try:
             source = Path(source_path)
+            # One stat gives both the type and, for files, the size
+            source_stat = source.stat()
 
-            if source.is_dir():
+            if stat.S_ISDIR(source_stat.st_mode):
                 return self._save_directory(source, filename)
             else:
-                return self._save_file(source, filename)
+                return self._save_file(source, filename, move=move, file_size=source_stat.st_size)
 
         except Exception as e:
             logger.error(f"Failed to save file to local storage: {e}")
             return None
 
-    def _save_file(self, source_path: Path, filename: str) -> Optional[str]:
-        """Save a single file to local storage"""
+    def _save_file(
+        self, source_path: Path, filename: str, move: bool = False, file_size: Optional[int] = None
+    ) -> Optional[str]:
+        """Save a single file to local storage (file_size: source size if already known)"""
         try:
-            file_size = os.path.getsize(source_path)
+            if file_size is None:
+                file_size = os.path.getsize(source_path)
             file_size_mb = file_size / (1024 * 1024)
 
             if not self.can_store_file(file_size_mb):
@@ -128,7 +297,12 @@ class LocalStorageManager:
                 name, ext = os.path.splitext(filename)
                 target_path = target_dir / f"{name}_{timestamp}{ext}"
 
-            shutil.copy2(source_path, target_path)
+            if move:
+                # Rename when on the same filesystem, copy + unlink otherwise
+                shutil.move(str(source_path), str(target_path))
+            else:
+                _copy_file(source_path, target_path, size=file_size)
+            self._adjust_usage(file_size)
 
             logger.info(f"File saved to local storage: {target_path} "
                        f"({file_size_mb:.1f}MB)")
@@ -163,7 +337,7 @@ class LocalStorageManager:
             target_path = None
             if html_file:
                 html_target = tweet_dir / html_file.name
-                shutil.copy2(html_file, html_target)
+                _copy_file(html_file, html_target)
                 target_path = html_target
 
             # Copy PDF file (if exists)
@@ -177,34 +351,33 @@ class LocalStorageManager:
                     pdf_target = tweet_dir / f"{name_without_ext}_{timestamp}.pdf"
 
                 try:
-                    shutil.copy2(pdf_file, pdf_target)
+                    _copy_file(pdf_file, pdf_target)
                     has_pdf = True
                     logger.info(f"PDF file copied: {pdf_target}")
                 except Exception as e:
                     logger.warning(f"Failed to copy PDF file: {e}")
 
-            # Copy images to tweet directory
-            images_source = source_dir / "images"
-            if images_source.exists():
-                images_target = tweet_dir / "images"
-                images_target.mkdir(exist_ok=True)
-
-                for img_file in images_source.iterdir():
-                    if img_file.is_file():
-                        shutil.copy2(img_file, images_target / img_file.name)
-
-            # Copy videos to tweet directory
-            videos_source = source_dir / "videos"
-            if videos_source.exists():
-                videos_target = tweet_dir / "videos"
-                videos_target.mkdir(exist_ok=True)
+            # Collect images and videos, then copy them as one batch
+            media_pairs = []
+            media_found = {}
+            for media_dir in ("images", "videos"):
+                media_source = source_dir / media_dir
+                media_found[media_dir] = media_source.is_dir()
+                if not media_found[media_dir]:
+                    continue
+                media_target = tweet_dir / media_dir
+                media_target.mkdir(exist_ok=True)
+                media_pairs.extend(
+                    (media_file, media_target / media_file.name)
+                    for media_file in _list_files(media_source)
+                )
+            _copy_files(media_pairs)
 
-                for video_file in videos_source.iterdir():
-                    if video_file.is_file():
-                        shutil.copy2(video_file, videos_target / video_file.name)
+            saved_files, _ = self._scan_tree(tweet_dir)
+            self._adjust_usage(sum(file_stat.st_size for _, file_stat in saved_files))
 
-            has_images = images_source.exists()
-            has_videos = videos_source.exists()
+            has_images = media_found["images"]
+            has_videos = media_found["videos"]
             if has_images or has_videos or has_pdf:
                 logger.info(
                     f"Directory saved to local storage: {tweet_dir} "
@@ -226,6 +399,44 @@ class LocalStorageManager:
             logger.error(f"Failed to save directory: {e}")
             return None
 
+    def _scan_tree(
+        self, root: Path, skip_dir: Optional[Path] = None
+    ) -> Tuple[List[Tuple[str, os.stat_result]], List[str]]:
+        """
+        Walk root with os.scandir
+
+        Args:
+            root: Directory to walk
+            skip_dir: Directory to leave out entirely (with its contents)
+
+        Returns:
+            tuple: ([(file_path, stat_result), ...], [directory_path, ...])
+        """
+        files = []
+        directories = []
+        pending = [str(root)]
+        skip_path = str(skip_dir) if skip_dir else None
+
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.path == skip_path:
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                directories.append(entry.path)
+                                pending.append(entry.path)
+                            elif entry.is_file():
+                                files.append((entry.path, entry.stat()))
+                        except OSError as e:
+                            logger.debug(f"Could not stat {entry.path}: {e}")
+            except OSError as e:
+                logger.debug(f"Could not scan directory {current}: {e}")
+
+        return files, directories
+
     def cleanup_old_files(self) -> Dict[str, Any]:
         """
         Clean up expired local files
@@ -243,24 +454,29 @@ class LocalStorageManager:
         }
 
         try:
-            cutoff_date = datetime.now() - timedelta(days=self.cleanup_after_days)
+            # Compare raw st_mtime floats against one precomputed cutoff
+            cutoff_ts = time.time() - self.cleanup_after_days * 86400
 
-            for file_path in self.storage_path.rglob('*'):
-                if not file_path.is_file():
-                    continue
+            # One scandir pass: DirEntry.stat() is the only stat per file.
+            # The staging directory holds in-progress downloads; leave it alone
+            files, directories = self._scan_tree(
+                self.storage_path, skip_dir=self.storage_path / TEMP_DIR_NAME
+            )
 
+            storage_root = str(self.storage_path)
+            remaining_bytes = 0
+            for file_path, file_stat in files:
+                remaining_bytes += file_stat.st_size
+                if (os.path.dirname(file_path) == storage_root
+                        and os.path.basename(file_path).startswith(CACHE_QUEUE_PREFIX)):
+                    continue
                 try:
-                    # Get file modification time
-                    file_mtime = datetime.fromtimestamp(
-                        file_path.stat().st_mtime
-                    )
-
                     # Delete if expired
-                    if file_mtime < cutoff_date:
-                        file_size = file_path.stat().st_size
-                        file_size_mb = file_size / (1024 * 1024)
+                    if file_stat.st_mtime < cutoff_ts:
+                        file_size_mb = file_stat.st_size / (1024 * 1024)
 
-                        file_path.unlink()
+                        os.unlink(file_path)
+                        remaining_bytes -= file_stat.st_size
 
                         cleanup_stats["files_removed"] += 1
                         cleanup_stats["space_freed_mb"] += file_size_mb
@@ -278,23 +494,22 @@ class LocalStorageManager:
                         f"Failed to delete file: {file_path}, error: {e}"
                     )
 
-            # Remove empty directories left after file cleanup
+            # The walk just measured the whole tree; refresh the usage cache
+            with self._usage_lock:
+                self._usage_bytes = remaining_bytes
+                self._usage_at = time.monotonic()
+
+            # Remove empty directories left after file cleanup,
+            # deepest first so emptied parents can go too
             dirs_removed = 0
-            for dir_path in sorted(
-                self.storage_path.rglob('*'), reverse=True
-            ):
-                if dir_path.is_dir():
-                    try:
-                        if not any(dir_path.iterdir()):
-                            dir_path.rmdir()
-                            dirs_removed += 1
-                            logger.debug(
-                                f"Removed empty directory: {dir_path}"
-                            )
-                    except Exception as e:
-                        logger.debug(
-                            f"Could not remove directory {dir_path}: {e}"
-                        )
+            for dir_path in sorted(directories, reverse=True):
+                try:
+                    os.rmdir(dir_path)
+                    dirs_removed += 1
+                    logger.debug(f"Removed empty directory: {dir_path}")
+                except OSError:
+                    # Not empty (or not removable) - keep it
+                    pass
 
             if dirs_removed:
                 logger.info(f"Removed {dirs_removed} empty directories")
@@ -315,16 +530,17 @@ class LocalStorageManager:
         """Get information about a local file"""
         try:
             path = Path(file_path)
-            if not path.exists():
+            try:
+                file_stat = path.stat()
+            except FileNotFoundError:
                 return None
 
-            stat = path.stat()
             return {
                 "path": str(path),
-                "size": stat.st_size,
-                "size_mb": stat.st_size / (1024 * 1024),
-                "created": datetime.fromtimestamp(stat.st_ctime),
-                "modified": datetime.fromtimestamp(stat.st_mtime),
+                "size": file_stat.st_size,
+                "size_mb": file_stat.st_size / (1024 * 1024),
+                "created": datetime.fromtimestamp(file_stat.st_ctime),
+                "modified": datetime.fromtimestamp(file_stat.st_mtime),
                 "filename": path.name
             }
         except Exception as e:
@@ -335,13 +551,15 @@ class LocalStorageManager:
         """Delete a local file"""
         try:
             path = Path(file_path)
-            if path.exists():
-                path.unlink()
-                logger.info(f"Local file deleted: {file_path}")
-                return True
-            else:
+            try:
+                file_size = path.stat().st_size
+            except FileNotFoundError:
                 logger.warning(f"File not found, cannot delete: {file_path}")
                 return False
+            path.unlink()
+            self._adjust_usage(-file_size)
+            logger.info(f"Local file deleted: {file_path}")
+            return True
         except Exception as e:
             logger.error(f"Failed to delete local file: {e}")
             return False
@@ -353,12 +571,12 @@ local_storage_manager = LocalStorageManager()
 
 async def cleanup_local_storage() -> Dict[str, Any]:
     """Async wrapper for local storage cleanup"""
-    return await asyncio.to_thread(local_storage_manager.cleanup_old_files)
+    return await local_storage_manager.run_io(local_storage_manager.cleanup_old_files)
 
 
-def save_file_locally(source_path: str, filename: str) -> Optional[str]:
+def save_file_locally(source_path: str, filename: str, move: bool = False) -> Optional[str]:
     """Convenience function to save file locally"""
-    return local_storage_manager.save_file_locally(source_path, filename)
+    return local_storage_manager.save_file_locally(source_path, filename, move=move)
 
 
 def get_local_storage_info() -> Dict[str, Any]:
@@ -367,11 +585,12 @@ def get_local_storage_info() -> Dict[str, Any]:
     if not manager.enabled:
         return {"enabled": False}
 
+    summary = manager.get_disk_summary()
     return {
         "enabled": True,
-        "path": str(manager.storage_path),
-        "usage_mb": manager.get_storage_usage_mb(),
-        "available_space_mb": manager.get_available_space_mb(),
+        "path": summary["path"],
+        "usage_mb": summary["usage_mb"],
+        "available_space_mb": summary["available_mb"],
         "max_size_mb": manager.max_size_mb,
         "cleanup_after_days": manager.cleanup_after_days
     }
\ No newline at end of file
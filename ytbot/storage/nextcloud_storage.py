@@ -6,20 +6,81 @@ Provides Nextcloud WebDAV integration for cloud storage.
 
 import os
 import time
+import random
+from requests.adapters import HTTPAdapter
 from webdav3.client import Client as NextcloudClient
-from typing import Optional, Dict, Any
+from webdav3.exceptions import LocalResourceNotFound, NotEnoughSpace, ResponseErrorCode
+from webdav3.urn import Urn
+from typing import Optional, Dict, Any, Set
 
 from ..core.config import CONFIG
 from ..core.enhanced_logger import get_logger
 
 logger = get_logger(__name__)
 
+# 4xx responses that are still worth retrying (timeout, locked, rate limited)
+_RETRYABLE_CLIENT_ERRORS = {408, 423, 429}
+
+# PUT statuses that confirm the server stored the whole body: requests sends
+# Content-Length for uploads, so no follow-up listing is needed
+_PUT_STORED = {200, 201, 204}
+
+# Keep-alive connections kept per host; requests defaults to 10, fewer than
+# parallel retry uploads plus live uploads can need, and a full pool drops
+# connections (new TCP+TLS handshake next time)
+HTTP_POOL_SIZE = 16
+
+
+def _drain(response) -> None:
+    """Read a streamed reply to the end so its connection returns to the pool"""
+    for _ in response.iter_content(64 * 1024):
+        pass
+    response.close()
+
+
+def _is_permanent_upload_error(error: Exception) -> bool:
+    """Whether retrying an upload that raised error cannot succeed"""
+    if isinstance(error, (LocalResourceNotFound, FileNotFoundError, NotEnoughSpace)):
+        return True
+    if isinstance(error, ResponseErrorCode):
+        return 400 <= error.code < 500 and error.code not in _RETRYABLE_CLIENT_ERRORS
+    return False
+
+
+class _UploadReader:
+    """
+    File body for WebDAV PUT requests that reads in large blocks.
+
+    HTTP libraries pull request bodies in small (8-16 KiB) blocks; this reader
+    ignores the requested size and returns chunk_size bytes per read, filled
+    with readinto() into one reusable buffer. Its length lets requests send a
+    Content-Length header instead of chunked transfer encoding.
+    """
+
+    def __init__(self, file_obj, size: int, chunk_size: int):
+        self._file = file_obj
+        self._size = size
+        self._buffer = bytearray(max(chunk_size, 64 * 1024))
+        self._view = memoryview(self._buffer)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, size: int = -1) -> memoryview:
+        # The previous block has been sent by the time the next one is read,
+        # so the buffer can be refilled in place
+        count = self._file.readinto(self._buffer)
+        return self._view[:count or 0]
+
 
 class NextcloudStorage:
     """Nextcloud storage backend using WebDAV"""
 
     def __init__(self):
         self.client: Optional[NextcloudClient] = None
+        # Remote directories (no leading/trailing slash) known to exist, so
+        # repeated uploads into the same folder skip the PROPFIND/MKCOL calls
+        self._known_dirs: Set[str] = set()
         self._connect()
 
     def _connect(self):
@@ -40,6 +101,13 @@ class NextcloudStorage:
             }
 
             self.client = NextcloudClient(options)
+
+            # The client sends everything through one requests.Session; size
+            # its pool so concurrent uploads all reuse keep-alive connections
+            pool_size = max(HTTP_POOL_SIZE, CONFIG['nextcloud']['parallel_uploads'])
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            self.client.session.mount('https://', adapter)
+            self.client.session.mount('http://', adapter)
             logger.info("Nextcloud client initialized successfully")
 
         except Exception as e:
@@ -90,10 +158,11 @@ class NextcloudStorage:
 
                 # Upload file
                 logger.info(f"Uploading file to Nextcloud: {remote_path}")
-                self.client.upload_sync(remote_path=remote_path, local_path=local_path)
+                status = self._put_file(local_path, remote_path)
 
-                # Verify upload
-                if self._verify_upload(remote_path, local_path):
+                # A stored-status reply is the verification; list the
+                # folder only for unusual replies
+                if status in _PUT_STORED or self._verify_upload(remote_path, local_path):
                     # Build file URL
                     base_url = CONFIG['nextcloud']['url'].rstrip('/')
                     file_url = (
@@ -107,10 +176,18 @@ class NextcloudStorage:
 
             except Exception as e:
                 logger.error(f"Upload attempt {attempt + 1}/{max_retries} failed: {e}")
+                # The folder may have been removed remotely; check it again
+                self._forget_directory(os.path.dirname(remote_path))
+
+                if _is_permanent_upload_error(e):
+                    # Auth/permission/missing-file errors will not heal on retry
+                    logger.error("Upload error is not retryable, giving up")
+                    return None
 
                 if attempt < max_retries - 1:
-                    # Exponential backoff
-                    delay = retry_delay * (2 ** attempt)
+                    # Exponential backoff with jitter, so parallel uploads
+                    # that failed together do not retry in lockstep
+                    delay = retry_delay * (2 ** attempt) + random.uniform(0, retry_delay)
                     logger.info(f"Retrying in {delay:.2f} seconds...")
                     time.sleep(delay)
                 else:
@@ -119,6 +196,22 @@ class NextcloudStorage:
 
         return None
 
+    def _put_file(self, local_path: str, remote_path: str) -> int:
+        """
+        Stream a local file to remote_path with a single WebDAV PUT
+
+        Returns:
+            int: HTTP status of the PUT (errors >= 400 raise instead)
+        """
+        chunk_size = CONFIG['nextcloud']['chunk_size']
+        with open(local_path, 'rb', buffering=0) as local_file:
+            body = _UploadReader(local_file, os.fstat(local_file.fileno()).st_size, chunk_size)
+            response = self.client.execute_request(
+                action='upload', path=Urn(remote_path).quote(), data=body
+            )
+        _drain(response)
+        return response.status_code
+
     def upload_directory(self, local_dir: str, remote_dir: str) -> Dict[str, Any]:
         """
         Upload a directory and all its contents to Nextcloud
@@ -187,13 +280,11 @@ class NextcloudStorage:
                             f"Uploading: {local_file_path} -> "
                             f"{remote_file_path}"
                         )
-                        self.client.upload_sync(
-                            remote_path=remote_file_path,
-                            local_path=local_file_path
-                        )
+                        self._put_file(local_file_path, remote_file_path)
                         uploaded_files.append(remote_file_path)
                         logger.info(f"Successfully uploaded: {file}")
                     except Exception as e:
+                        self._forget_directory(os.path.dirname(remote_file_path))
                         error_msg = f"Failed to upload {file}: {e}"
                         logger.error(error_msg)
                         errors.append(error_msg)
@@ -241,16 +332,29 @@ class NextcloudStorage:
             result["errors"].append(error_msg)
             return result
 
+    def _remember_directory(self, remote_dir: str) -> None:
+        """Record remote_dir and its parents as existing"""
+        parts = [part for part in remote_dir.split('/') if part]
+        for depth in range(1, len(parts) + 1):
+            self._known_dirs.add('/'.join(parts[:depth]))
+
+    def _forget_directory(self, remote_dir: str) -> None:
+        """Drop remote_dir from the known directories"""
+        self._known_dirs.discard(remote_dir.strip('/'))
+
     def _ensure_directory_exists(self, remote_dir: str):
         """Ensure remote directory exists, create if necessary"""
-        try:
-            # Remove leading slash for WebDAV operations
-            path_without_slash = remote_dir.lstrip('/')
+        # Remove leading slash for WebDAV operations
+        path_without_slash = remote_dir.strip('/')
+        if path_without_slash in self._known_dirs:
+            return
 
+        try:
             # Check if directory exists
             try:
                 self.client.list(path_without_slash)
                 logger.debug(f"Remote directory exists: {remote_dir}")
+                self._remember_directory(path_without_slash)
                 return
             except Exception:
                 # Directory doesn't exist, create it
@@ -263,13 +367,20 @@ class NextcloudStorage:
                 for part in path_parts:
                     if part:
                         current_path = f"{current_path}/{part}"
+                        if current_path.lstrip('/') in self._known_dirs:
+                            continue
                         try:
+                            # The full path was just listed and is missing
+                            if current_path.lstrip('/') == path_without_slash:
+                                raise FileNotFoundError(remote_dir)
                             self.client.list(current_path.lstrip('/'))
                         except Exception:
                             # Directory doesn't exist, create it
                             self.client.mkdir(current_path.lstrip('/'))
                             logger.debug(f"Created directory: {current_path}")
 
+                self._remember_directory(path_without_slash)
+
         except Exception as e:
             logger.error(f"Failed to ensure directory exists: {remote_dir}, error: {e}")
             raise
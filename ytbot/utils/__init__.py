@@ -20,6 +20,7 @@ from .common import (
     chunk_list,
     deep_merge,
     mask_sensitive_data,
+    TTLCache,
 )
 
 __all__ = [
@@ -40,4 +41,5 @@ __all__ = [
     "chunk_list",
     "deep_merge",
     "mask_sensitive_data",
+    "TTLCache",
 ]
@@ -6,7 +6,8 @@ Provides async wrappers and utilities for common operations.
 
 import asyncio
 import functools
-from typing import Callable, Any, TypeVar, Optional, Coroutine
+import random
+from typing import Callable, Any, TypeVar, Optional, Coroutine, Dict, Hashable
 from concurrent.futures import ThreadPoolExecutor
 import time
 
@@ -86,6 +87,7 @@ async def retry_with_backoff(
     initial_delay: float = 1.0,
     max_delay: float = 60.0,
     backoff_factor: float = 2.0,
+    jitter: float = 0.1,
     retry_exceptions: tuple = (Exception,),
     **kwargs: Any
 ) -> T:
@@ -99,6 +101,8 @@ async def retry_with_backoff(
         initial_delay: Initial delay between retries
         max_delay: Maximum delay between retries
         backoff_factor: Factor to increase delay
+        jitter: Fraction by which each delay is randomly stretched or
+            shrunk, so concurrent callers do not retry in lockstep
         retry_exceptions: Exceptions to retry on
         **kwargs: Keyword arguments
         
@@ -117,7 +121,7 @@ async def retry_with_backoff(
         except retry_exceptions as e:
             last_exception = e
             if attempt < max_retries:
-                await asyncio.sleep(delay)
+                await asyncio.sleep(delay * (1 + random.uniform(-jitter, jitter)))
                 delay = min(delay * backoff_factor, max_delay)
             else:
                 break
@@ -177,7 +181,9 @@ def async_retry(
     max_retries: int = 3,
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    max_delay: float = 60.0,
+    jitter: float = 0.1
 ):
     """
     Decorator to retry async functions.
@@ -187,6 +193,8 @@ def async_retry(
         initial_delay: Initial delay between retries
         backoff_factor: Factor to increase delay
         exceptions: Exceptions to retry on
+        max_delay: Maximum delay between retries
+        jitter: Random fraction applied to each delay
         
     Returns:
         Decorator function
@@ -198,7 +206,9 @@ def async_retry(
                 func, *args,
                 max_retries=max_retries,
                 initial_delay=initial_delay,
+                max_delay=max_delay,
                 backoff_factor=backoff_factor,
+                jitter=jitter,
                 retry_exceptions=exceptions,
                 **kwargs
             )
@@ -229,6 +239,44 @@ async def gather_with_concurrency(
     return await asyncio.gather(*(sem_coro(c) for c in coros))
 
 
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one in-flight execution"""
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """
+        Run func for key, or wait for the call already running for key.
+
+        The shared call runs as its own task, so cancelling one caller
+        (including the one that started it) does not cancel the others.
+
+        Args:
+            key: Identity of the work (e.g. a URL)
+            func: Zero-argument async callable producing the result
+
+        Returns:
+            Result of the (shared) call
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark as retrieved in case every caller was cancelled
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
 class AsyncTimer:
     """Async timer for periodic tasks"""
     
@@ -6,9 +6,12 @@ Provides shared utility functions used across the application.
 
 import re
 import os
+import time
 import hashlib
 import html
-from typing import Optional, List, Dict, Any, Tuple, TypeVar, Union
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, TypeVar, Union, Hashable
 from pathlib import Path
 from datetime import datetime
 
@@ -17,6 +20,9 @@ from datetime import datetime
 PathLike = Union[str, Path]
 T = TypeVar('T')
 
+# Characters not allowed in filenames, deleted by one str.translate pass
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
 
 def sanitize_filename(filename: str, max_length: int = 100) -> str:
     """
@@ -30,13 +36,11 @@ def sanitize_filename(filename: str, max_length: int = 100) -> str:
         Sanitized filename
     """
     # Remove invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', filename)
-    
-    # Replace multiple spaces with single space
-    sanitized = re.sub(r'\s+', ' ', sanitized)
+    sanitized = filename.translate(_INVALID_FILENAME_CHARS)
     
-    # Strip leading/trailing whitespace
-    sanitized = sanitized.strip()
+    # Collapse whitespace runs to single spaces and strip the ends
+    # (str.split() uses the same whitespace definition as \s)
+    sanitized = ' '.join(sanitized.split())
     
     # Limit length
     if len(sanitized) > max_length:
@@ -388,3 +392,83 @@ def mask_sensitive_data(data: Dict[str, Any], sensitive_keys: Optional[List[str]
             result[key] = value
     
     return result
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Expiry uses time.monotonic(), so wall-clock changes do not affect it.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 600.0):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted first)
+            ttl: Default time-to-live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional time-to-live overriding the cache default
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key and return its value (expired entries return default)"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -3,11 +3,23 @@
 使用浏览器自动化获取真实内容并保存到Notion的脚本
 """
 
+import asyncio
 import subprocess
 import json
 import os
 import sys
-from notion_client import Client
+
+# notion-client只在保存到Notion时需要；提取内容不依赖它
+try:
+    from notion_client import Client
+except ImportError:
+    Client = None
+
+# Notion单个rich text块的最大字符数
+MAX_CHUNK_SIZE = 2000
+
+# Notion单次请求最多接受的子块数量
+MAX_CHILDREN_PER_REQUEST = 100
 
 
 def extract_content_with_js(url):
@@ -48,8 +60,70 @@ def extract_content_with_js(url):
         return None, None
 
 
+async def _scrape_with_playwright(url):
+    """用ytbot的Python Playwright提取器抓取一次并释放浏览器"""
+    from ytbot.platforms.twitter import TwitterContentExtractor
+    from ytbot.core.browser_manager import shutdown_browser
+
+    extractor = TwitterContentExtractor()
+    try:
+        return await extractor.scrape_tweet(url)
+    finally:
+        await extractor.close_browser()
+        await shutdown_browser()
+
+
+def extract_content(url):
+    """
+    提取X内容
+
+    优先在本进程内使用ytbot的Python Playwright提取器，省去Node.js进程；
+    未安装ytbot或Python版Playwright，或进程内提取失败时，退回到JavaScript脚本
+    """
+    try:
+        from ytbot.platforms.twitter import PLAYWRIGHT_AVAILABLE
+    except ImportError:
+        PLAYWRIGHT_AVAILABLE = False
+
+    if not PLAYWRIGHT_AVAILABLE:
+        return extract_content_with_js(url)
+
+    try:
+        data = asyncio.run(_scrape_with_playwright(url))
+    except Exception as e:
+        print(f"Playwright提取出错，改用JavaScript脚本: {str(e)}")
+        return extract_content_with_js(url)
+
+    if data.get('success'):
+        return data['title'], data['content']
+    print(f"Playwright提取失败，改用JavaScript脚本: {data.get('error', 'Unknown error')}")
+    return extract_content_with_js(url)
+
+
+def _paragraph_block(content):
+    """构造包含一段文本的Notion段落块"""
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": content
+                    }
+                }
+            ]
+        }
+    }
+
+
 def save_to_notion_with_real_content(token, database_id, title_property, original_url, title, content):
     """将真实提取的内容保存到Notion"""
+    if Client is None:
+        print("错误: 未安装notion-client，请运行 pip install notion-client")
+        return None
+
     # 初始化Notion客户端
     notion = Client(auth=token)
 
@@ -61,46 +135,18 @@ def save_to_notion_with_real_content(token, database_id, title_property, origina
 
     # 添加内容段落
     # 由于Notion API对单个块的长度有限制，我们需要分割长文本
-    paragraphs = full_content.split('\n\n')
-    for paragraph in paragraphs:
-        if paragraph.strip():  # 忽略空段落
-            # 如果段落太长，进一步分割（Notion rich text content限制约为2000字符）
-            max_chunk_size = 2000
-            while len(paragraph) > max_chunk_size:
-                chunk = paragraph[:max_chunk_size]
-                paragraph = paragraph[max_chunk_size:]
-
-                children.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": chunk
-                                }
-                            }
-                        ]
-                    }
-                })
-
-            # 添加剩余部分（如果有的话）
-            if paragraph.strip():
-                children.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": paragraph.strip()
-                                }
-                            }
-                        ]
-                    }
-                })
+    # （Notion rich text content限制约为2000字符）
+    for paragraph in full_content.split('\n\n'):
+        if not paragraph.strip():  # 忽略空段落
+            continue
+        # 一次性按固定区间切分，避免反复复制剩余文本
+        chunks = [paragraph[i:i + MAX_CHUNK_SIZE] for i in range(0, len(paragraph), MAX_CHUNK_SIZE)]
+        children.extend(_paragraph_block(chunk) for chunk in chunks[:-1])
+
+        # 添加剩余部分（如果有的话）
+        last_chunk = chunks[-1].strip()
+        if last_chunk:
+            children.append(_paragraph_block(last_chunk))
 
     # 创建新页面
     new_page = notion.pages.create(
@@ -116,9 +162,16 @@ def save_to_notion_with_real_content(token, database_id, title_property, origina
                 ]
             }
         },
-        children=children
+        children=children[:MAX_CHILDREN_PER_REQUEST]
     )
 
+    # 超出单次请求上限的块按顺序分批追加（并发追加会打乱段落顺序）
+    for i in range(MAX_CHILDREN_PER_REQUEST, len(children), MAX_CHILDREN_PER_REQUEST):
+        notion.blocks.children.append(
+            block_id=new_page['id'],
+            children=children[i:i + MAX_CHILDREN_PER_REQUEST]
+        )
+
     return new_page['id']
 
 
@@ -146,7 +199,7 @@ def main():
         return
 
     # 提取真实内容
-    title, content = extract_content_with_js(url)
+    title, content = extract_content(url)
 
     if title and content:
         print(f"成功提取内容:")